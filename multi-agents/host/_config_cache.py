@@ -0,0 +1,55 @@
+"""Shared, memoized access to the host config.yaml.
+
+config.yaml is developer-authored and immutable at runtime, so it is parsed
+once per process and the resulting dict is shared across agent.py,
+host_agent_bedrock.py, and host_invocation_example.py.
+
+The Docker build pre-compiles config.yaml to config.json so container
+startup pays json.load (C parser) instead of PyYAML. When the JSON artifact
+is absent (local development), the YAML source is parsed directly.
+"""
+import functools
+import json
+from pathlib import Path
+from urllib.parse import quote
+
+import yaml
+
+try:
+    from host.utils import _YAML_LOADER
+except ImportError:
+    from utils import _YAML_LOADER
+
+_CONFIG_PATH = Path(__file__).parent / "config.yaml"
+_COMPILED_CONFIG_PATH = _CONFIG_PATH.with_suffix(".json")
+
+
+def _annotate_agent(agent_config: dict) -> None:
+    """Precompute URL fields derived from the runtime ARN.
+
+    quote() scans the string character-by-character in Python, so escape each
+    ARN once at load time instead of on every invocation.
+    """
+    escaped = quote(agent_config["runtime_arn"], safe="")
+    agent_config["_escaped_arn"] = escaped
+    agent_config["_runtime_url"] = (
+        f"https://bedrock-agentcore.{agent_config['region']}.amazonaws.com/"
+        f"runtimes/{escaped}/invocations/"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> dict:
+    """Parse the config once and return the shared config dict."""
+    if _COMPILED_CONFIG_PATH.exists():
+        with open(_COMPILED_CONFIG_PATH, "r") as f:
+            config = json.load(f)
+    else:
+        with open(_CONFIG_PATH, "r") as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+
+    for section in ("agents", "host-agent"):
+        for agent_config in config.get(section) or []:
+            _annotate_agent(agent_config)
+
+    return config
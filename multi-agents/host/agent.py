@@ -1,86 +1,263 @@
+import asyncio
+import contextvars
+import functools
+import logging
+
 from a2a.client import A2ACardResolver, ClientConfig, ClientFactory
 from google.adk.agents.llm_agent import Agent
 from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
 from urllib.parse import quote
 import boto3
 import httpx
-import json
 import os
+import time
 import uuid
-import yaml
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 IS_DOCKER = os.getenv("DOCKER_CONTAINER", "0") == "1"
 
 if IS_DOCKER:
-    from utils import get_ssm_parameter, get_aws_info
+    from utils import get_ssm_parameter, get_aws_info, json_loads
+    from _config_cache import get_config
 else:
-    from host.utils import get_ssm_parameter, get_aws_info
+    from host.utils import get_ssm_parameter, get_aws_info, json_loads
+    from host._config_cache import get_config
 
 
 # AWS and agent configuration
 account_id, region = get_aws_info()
 
-def load_config():
-    config_path = "config.yaml" if IS_DOCKER else "host/config.yaml"
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+config = get_config()
+
+# Shared async HTTP client for token fetches. Connection pooling with HTTP/2
+# keep-alive avoids a fresh TCP/TLS handshake to Cognito on every call; the
+# client lives for the process lifetime.
+_HTTPX = httpx.AsyncClient(
+    timeout=30.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
 
-config = load_config()
+@functools.lru_cache(maxsize=8)
+def _ssm_client(region: str):
+    """Reuse one SSM client per region; construction is tens of ms of botocore
+    model parsing and clients keep their own connection pool."""
+    return boto3.client("ssm", region_name=region)
+
+
+# IDP configs are immutable for the process lifetime in practice; cache them
+# with a TTL so each A2A sub-agent doesn't cost an SSM round trip per session.
+_SSM_CACHE_TTL = 300  # seconds
+_ssm_cache = {}  # (parameter_path, region) -> (config, fetched_at)
 
 
 def fetch_ssm_parameter(parameter_path: str, region: str) -> dict:
-    """Fetch IDP configuration from SSM Parameter Store."""
-    ssm = boto3.client("ssm", region_name=region)
+    """Fetch IDP configuration from SSM Parameter Store, cached with a TTL."""
+    cached = _ssm_cache.get((parameter_path, region))
+    if cached and time.monotonic() - cached[1] < _SSM_CACHE_TTL:
+        return cached[0]
+    ssm = _ssm_client(region)
     response = ssm.get_parameter(Name=parameter_path, WithDecryption=True)
-    config_str = response["Parameter"]["Value"]
-    return json.loads(config_str)
+    idp_config = json_loads(response["Parameter"]["Value"])
+    _ssm_cache[(parameter_path, region)] = (idp_config, time.monotonic())
+    return idp_config
 
-async def get_bearer_token(idp_config: dict) -> str:
-    """Get OAuth bearer token using client credentials flow."""
-    domain = idp_config["domain"]
-    region = idp_config["user_pool_id"].split("_")[0]
-    token_endpoint = f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
-    
-    scopes = idp_config.get("scopes", [])
-    resource_server = idp_config["resource_server_identifier"]
-    scope_str = " ".join([f"{resource_server}/{scope}" for scope in scopes])
-    
-    token_data = {
-        "grant_type": "client_credentials",
-        "client_id": idp_config["client_id"],
-        "client_secret": idp_config["client_secret"],
-        "scope": scope_str,
-    }
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            token_endpoint,
-            data=token_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+
+def fetch_ssm_parameters_batch(parameter_paths: list, region: str) -> dict:
+    """Fetch multiple IDP configurations with batched SSM GetParameters calls.
+
+    Collapses N GetParameter round trips into ceil(N/10) calls (the API
+    accepts up to 10 names per request). Cached paths are served from the
+    shared TTL cache; only the misses hit SSM. Returns a dict keyed by
+    parameter path.
+    """
+    now = time.monotonic()
+    configs = {}
+    misses = []
+    for path in parameter_paths:
+        cached = _ssm_cache.get((path, region))
+        if cached and now - cached[1] < _SSM_CACHE_TTL:
+            configs[path] = cached[0]
+        else:
+            misses.append(path)
+
+    if not misses:
+        return configs
+
+    ssm = _ssm_client(region)
+    for i in range(0, len(misses), 10):
+        response = ssm.get_parameters(
+            Names=misses[i:i + 10], WithDecryption=True
         )
-        response.raise_for_status()
-        token_response = response.json()
-        return token_response["access_token"]
+        invalid = response.get("InvalidParameters")
+        if invalid:
+            raise ValueError(f"SSM parameters not found: {invalid}")
+        for parameter in response["Parameters"]:
+            idp_config = json_loads(parameter["Value"])
+            configs[parameter["Name"]] = idp_config
+            _ssm_cache[(parameter["Name"], region)] = (idp_config, time.monotonic())
+    return configs
+
+# Cognito client-credentials tokens are valid for ~1 hour; cache them per
+# (client, resource server) pair and refresh shortly before expiry so the
+# Cognito round trip stays off the per-session critical path.
+_TOKEN_STALE_MARGIN = 180  # seconds before expiry at which a refresh starts
+_token_cache = {}  # (client_id, resource_server) -> (token, expires_at)
+_token_lock = asyncio.Lock()
+
+
+def _token_request(idp_config: dict) -> tuple:
+    """Return (token_endpoint, token_data) for idp_config, computed once.
+
+    The endpoint URL, scope string, and client-credentials form body are all
+    static per IDP. idp_config dicts are cached per SSM path, so the result
+    is memoized on the dict itself instead of rebuilt per token fetch.
+    """
+    cached = idp_config.get("_token_request")
+    if cached is None:
+        domain = idp_config["domain"]
+        region = idp_config["user_pool_id"].split("_")[0]
+        token_endpoint = f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
+
+        scopes = idp_config.get("scopes", [])
+        resource_server = idp_config["resource_server_identifier"]
+        scope_str = " ".join(f"{resource_server}/{scope}" for scope in scopes)
+
+        token_data = {
+            "grant_type": "client_credentials",
+            "client_id": idp_config["client_id"],
+            "client_secret": idp_config["client_secret"],
+            "scope": scope_str,
+        }
+        cached = idp_config["_token_request"] = (token_endpoint, token_data)
+    return cached
+
+
+async def _fetch_bearer_token(idp_config: dict) -> tuple:
+    """Fetch a fresh OAuth bearer token; returns (token, expires_at)."""
+    token_endpoint, token_data = _token_request(idp_config)
+
+    response = await _HTTPX.post(
+        token_endpoint,
+        data=token_data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    token_response = response.json()
+    expires_at = time.monotonic() + token_response.get("expires_in", 3600)
+    return token_response["access_token"], expires_at
+
+
+async def _refresh_token(cache_key: tuple, idp_config: dict) -> str:
+    """Refresh the cached token for cache_key, deduplicating under a lock."""
+    async with _token_lock:
+        cached = _token_cache.get(cache_key)
+        if cached and time.monotonic() < cached[1] - _TOKEN_STALE_MARGIN:
+            # Another task refreshed while we waited on the lock
+            return cached[0]
+        try:
+            token, expires_at = await _fetch_bearer_token(idp_config)
+        except Exception:
+            logger.exception("Token refresh failed for client %s", cache_key[0])
+            raise
+        _token_cache[cache_key] = (token, expires_at)
+        return token
+
+
+# Background refresh tasks are held here so the event loop keeps a strong
+# reference until they finish; a bare create_task can be garbage-collected
+# mid-flight. The done callback drops the reference and retrieves the
+# exception (already logged by _refresh_token) so failures don't spam
+# "Task exception was never retrieved".
+_refresh_tasks: set = set()
+
+def _reap_refresh_task(task: asyncio.Task) -> None:
+    _refresh_tasks.discard(task)
+    if not task.cancelled():
+        task.exception()
+
+
+async def get_bearer_token(idp_config: dict) -> str:
+    """Get OAuth bearer token using client credentials flow.
+
+    Returns the cached token when fresh; when the token is stale (within
+    _TOKEN_STALE_MARGIN of expiry) it is returned immediately while a
+    background task refreshes it, and only an expired token blocks on the
+    Cognito round trip.
+    """
+    cache_key = (idp_config["client_id"], idp_config["resource_server_identifier"])
+    cached = _token_cache.get(cache_key)
+    if cached:
+        token, expires_at = cached
+        now = time.monotonic()
+        if now < expires_at - _TOKEN_STALE_MARGIN:
+            return token
+        if now < expires_at:
+            task = asyncio.create_task(_refresh_token(cache_key, idp_config))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_reap_refresh_task)
+            return token
+    return await _refresh_token(cache_key, idp_config)
+
+# The active AgentCore session id, bound per request by the entrypoint and
+# injected into outgoing A2A calls by an httpx request hook. Keeping session
+# state out of the clients lets root_agent be shared across sessions.
+_current_session_id = contextvars.ContextVar("agentcore_session_id", default=None)
+
+
+def set_current_session_id(session_id: str) -> None:
+    """Bind the AgentCore session id for the current request context."""
+    _current_session_id.set(session_id)
+
+
+def _make_request_hook(idp_config: dict):
+    """Build an httpx request hook injecting auth and session headers.
+
+    The bearer token comes from the token cache (so it stays valid across
+    token expiry) and the session id from the per-request context variable.
+    """
+    async def _inject_headers(request):
+        request.headers["Authorization"] = f"Bearer {await get_bearer_token(idp_config)}"
+        session_id = _current_session_id.get()
+        if session_id:
+            request.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"] = session_id
 
-async def create_simple_client_factory(agent_config: dict, session_id: str):
+    return _inject_headers
+
+
+async def create_simple_client_factory(agent_config: dict, idp_config: dict = None):
     """Create a simple client factory using direct token approach."""
-    # Fetch IDP config and get bearer token
-    idp_config = fetch_ssm_parameter(agent_config["ssm_idp_config_path"], agent_config["region"])
-    bearer_token = await get_bearer_token(idp_config)
-    
-    runtime_arn = agent_config["runtime_arn"]
-    region = agent_config["region"]
-    escaped_agent_arn = quote(runtime_arn, safe='')
-    runtime_url = f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations/"
-    
-    # Add authentication headers
-    headers = {
-        "Authorization": f"Bearer {bearer_token}",
-        "X-Amzn-Bedrock-AgentCore-Runtime-Session-Id": session_id
-    }
-    
-    httpx_client = httpx.AsyncClient(timeout=300.0, headers=headers)
+    # Fetch IDP config (unless pre-fetched by the caller).
+    # boto3 is blocking, so run the SSM call in a thread to keep the event
+    # loop free.
+    if idp_config is None:
+        idp_config = await asyncio.to_thread(
+            fetch_ssm_parameter, agent_config["ssm_idp_config_path"], agent_config["region"]
+        )
+
+    # Runtime URL is precomputed by the config cache; fall back for ad-hoc
+    # agent configs that didn't come from get_config()
+    runtime_url = agent_config.get("_runtime_url")
+    if runtime_url is None:
+        escaped_agent_arn = quote(agent_config["runtime_arn"], safe='')
+        runtime_url = (
+            f"https://bedrock-agentcore.{agent_config['region']}.amazonaws.com/"
+            f"runtimes/{escaped_agent_arn}/invocations/"
+        )
+
+    # Session-agnostic client: auth and session id are injected per request
+    # by the hook, so the client (and the agents built on it) can be reused
+    # across sessions; HTTP/2 multiplexes the streaming bodies over a pooled
+    # connection.
+    httpx_client = httpx.AsyncClient(
+        timeout=300.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        event_hooks={"request": [_make_request_hook(idp_config)]},
+    )
     
     # Get agent card
     resolver = A2ACardResolver(httpx_client=httpx_client, base_url=runtime_url)
@@ -94,28 +271,56 @@ async def create_simple_client_factory(agent_config: dict, session_id: str):
 
 
 async def get_root_agent(session_id: str, actor_id: str):
-    sub_agents = []
-    
-    for agent_config in config['agents']:
-        agent_card_url = (
-            f"https://bedrock-agentcore.{agent_config['region']}.amazonaws.com/runtimes/"
-            f"{quote(agent_config['runtime_arn'], safe='')}/invocations/.well-known/agent-card.json"
+    agent_configs = config['agents']
+
+    # One batched SSM call per region instead of one GetParameter per agent
+    paths_by_region = {}
+    for agent_config in agent_configs:
+        paths_by_region.setdefault(agent_config["region"], set()).add(
+            agent_config["ssm_idp_config_path"]
         )
-        
-        # Create simple client factory
-        factory, agent_card = await create_simple_client_factory(agent_config, session_id)
-        
+    # Run the blocking boto3 calls in threads so the event loop stays free
+    # and per-region batches overlap
+    region_results = await asyncio.gather(
+        *(
+            asyncio.to_thread(fetch_ssm_parameters_batch, sorted(paths), agent_region)
+            for agent_region, paths in paths_by_region.items()
+        )
+    )
+    idp_configs = {}
+    for result in region_results:
+        idp_configs.update(result)
+
+    # Each sub-agent setup (Cognito token -> card fetch) is independent, so
+    # fan out concurrently instead of awaiting serially.
+    factories = await asyncio.gather(
+        *(
+            create_simple_client_factory(ac, idp_configs[ac["ssm_idp_config_path"]])
+            for ac in agent_configs
+        )
+    )
+
+    sub_agents = []
+    for agent_config, (factory, agent_card) in zip(agent_configs, factories):
+        # Pass the card object already fetched by create_simple_client_factory
+        # so RemoteA2aAgent doesn't re-fetch the same card during resolution
         agent = RemoteA2aAgent(
             name=agent_config['name'].lower().replace('_', '_'),
             description=agent_config['description'],
-            agent_card=agent_card_url,
+            agent_card=agent_card,
             a2a_client_factory=factory,
         )
         sub_agents.append(agent)
 
-    # Create root agent
-    agent_descriptions = "\n".join([f"- {agent.name}: {agent.description}" for agent in sub_agents])
-    
+    # Create root agent; the descriptions only depend on config['agents'],
+    # so format them once and reuse across sessions
+    global _agent_descriptions
+    if _agent_descriptions is None:
+        _agent_descriptions = "\n".join(
+            [f"- {agent.name}: {agent.description}" for agent in sub_agents]
+        )
+    agent_descriptions = _agent_descriptions
+
     root_agent = Agent(
         model="gemini-2.0-flash",
         name="root_agent",
@@ -125,9 +330,31 @@ async def get_root_agent(session_id: str, actor_id: str):
 
     return root_agent
 
+# Cached pieces of the system instruction: the template is invariant, the
+# agent descriptions only depend on config, and the date changes at most daily
+_agent_descriptions = None
+_date_cache = ("", 0.0)
+
+
+def _current_date() -> str:
+    """Return today's date (YYYY-MM-DD), re-formatted at most once an hour."""
+    global _date_cache
+    date_str, formatted_at = _date_cache
+    now = time.monotonic()
+    if not date_str or now - formatted_at >= 3600:
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        _date_cache = (date_str, now)
+    return date_str
+
+
 def _get_system_instruction(agent_descriptions) -> str:
-        """Generate system instruction for the orchestrator agent."""
-        return f"""
+    """Generate system instruction for the orchestrator agent."""
+    return _INSTRUCTION_TEMPLATE.format(
+        agent_descriptions=agent_descriptions, date=_current_date()
+    )
+
+
+_INSTRUCTION_TEMPLATE = """
 Role: You are the Lead Orchestrator, an expert triage and coordination agent for incident response and operations management. Your primary function is to route user requests to the right specialist agent, track progress, and report back clearly.
 
 Specialist Agents Available:
@@ -160,44 +387,74 @@ Core Directives:
     - Monitoring_Agent: For AWS metrics, logs, CloudWatch alarms, Jira ticket creation
     - OpsRemediation_Agent: For searching remediation strategies, AWS documentation, troubleshooting guidance
 
-Today's Date (YYYY-MM-DD): {datetime.now().strftime("%Y-%m-%d")}
+Today's Date (YYYY-MM-DD): {date}
 """
 
+# Process-wide root agent cache: with session and auth headers injected per
+# request, the agent graph (and its SSM/Cognito/card setup) is built once
+# per worker instead of once per session
+_root_agent_cache = None
+_root_agent_lock = asyncio.Lock()
+
+
 async def get_agent_and_card(session_id: str, actor_id: str):
     """
     Lazy initialization of the root agent.
     This is called inside the entrypoint where workload identity is available.
+    The root agent is a process-wide singleton; only the session id binding
+    changes per request.
     """
+    global _root_agent_cache
+
+    set_current_session_id(session_id)
+
+    async with _root_agent_lock:
+        if _root_agent_cache is not None:
+            return _root_agent_cache
 
-    root_agent = await get_root_agent(session_id=session_id, actor_id=actor_id)
+        root_agent = await get_root_agent(session_id=session_id, actor_id=actor_id)
 
-    async def get_agents_cards():
-        agents_info = {}
-        sub_agents = root_agent.sub_agents
+        async def get_agents_cards():
+            agents_info = {}
+            sub_agents = root_agent.sub_agents
 
-        for agent in sub_agents:
-            agent_data = {}
+            # Resolve concurrently, skipping agents whose card is already populated
+            await asyncio.gather(
+                *(
+                    resolve()
+                    for agent in sub_agents
+                    if (resolve := getattr(agent, "_ensure_resolved", None))
+                    and not getattr(agent, "_agent_card", None)
+                )
+            )
 
-            # Access the source URL before resolution
-            if hasattr(agent, "_agent_card_source"):
-                agent_data["agent_card_url"] = agent._agent_card_source
+            for agent in sub_agents:
+                agent_data = {}
 
-            # Ensure resolution and access full agent card
-            if hasattr(agent, "_ensure_resolved"):
-                await agent._ensure_resolved()
+                # The source is a URL only when the card was passed by reference
+                source = getattr(agent, "_agent_card_source", None)
+                if isinstance(source, str):
+                    agent_data["agent_card_url"] = source
 
-                if hasattr(agent, "_agent_card") and agent._agent_card:
-                    card = agent._agent_card
-                    agent_data["agent_card"] = card.model_dump(exclude_none=True)
+                card = getattr(agent, "_agent_card", None)
+                if card:
+                    # The card is immutable once resolved and pydantic dumping
+                    # is not cheap, so memoize the dump on the agent
+                    card_dump = getattr(agent, "_agent_card_dump", None)
+                    if card_dump is None:
+                        card_dump = card.model_dump(mode="python", exclude_none=True)
+                        agent._agent_card_dump = card_dump
+                    agent_data["agent_card"] = card_dump
 
-            agents_info[agent.name] = agent_data
+                agents_info[agent.name] = agent_data
 
-        return agents_info
+            return agents_info
 
-    # Get agents cards info
-    agents_cards = await get_agents_cards()
+        # Get agents cards info
+        agents_cards = await get_agents_cards()
 
-    return root_agent, agents_cards
+        _root_agent_cache = (root_agent, agents_cards)
+        return _root_agent_cache
 
 
 async def main():
@@ -13,13 +13,11 @@ import logging
 import urllib.parse
 import uuid
 from datetime import datetime
-from pathlib import Path
 from typing import Any, AsyncIterable, Dict, List, Optional
 
 import boto3
 import httpx
 import nest_asyncio
-import yaml
 from a2a.client import A2ACardResolver, A2AClient
 from a2a.types import (
     AgentCard,
@@ -38,6 +36,11 @@ from google.adk.sessions import InMemorySessionService
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
+try:
+    from host._config_cache import get_config
+except ImportError:
+    from _config_cache import get_config
+
 
 load_dotenv()
 nest_asyncio.apply()
@@ -51,12 +54,10 @@ logger = logging.getLogger(__name__)
 
 
 def _load_config() -> dict:
-    """Load configuration from config.yaml file."""
-    config_path = Path(__file__).parent / "config.yaml"
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-        logger.info("Loaded host agent configuration")
-        return config
+    """Load configuration from config.yaml via the shared parsed cache."""
+    config = get_config()
+    logger.info("Loaded host agent configuration")
+    return config
 
 
 def _fetch_ssm_parameter(
@@ -4,11 +4,18 @@ from google.adk.sessions import InMemorySessionService
 from google.adk.runners import Runner
 from google.genai import types
 from bedrock_agentcore import BedrockAgentCoreApp
+import functools
 import os
-import yaml
 import boto3
 from botocore.exceptions import ClientError
-from pathlib import Path
+
+IS_DOCKER = os.getenv("DOCKER_CONTAINER", "0") == "1"
+
+if IS_DOCKER:
+    from _config_cache import get_config
+else:
+    from host._config_cache import get_config
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -18,10 +25,8 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env file
 load_dotenv()
 
-# Load config from config.yaml relative to this file
-config_path = Path(__file__).parent / "config.yaml"
-with open(config_path, 'r') as f:
-    config_data = yaml.safe_load(f)
+# Config is parsed once per process and shared across the host modules
+config_data = get_config()
 
 APP_NAME = "HostAgentA2A"
 
@@ -50,13 +55,17 @@ async def call_agent(payload: dict, context):
     if not session_id:
         raise Exception("Context session_id is not set")
 
-    if not root_agent:
-        # Import agent creation inside entrypoint so workload identity is available
-        from agent import get_agent_and_card
+    # Import agent module inside entrypoint so workload identity is available
+    from agent import get_agent_and_card, set_current_session_id
 
+    # Bind this request's session id; A2A calls pick it up via a header hook,
+    # so the cached root agent never carries a stale session header
+    set_current_session_id(session_id)
+
+    if not root_agent:
         logger.info("Initializing root agent and resolving agent cards...")
-        # Create root agent once - LazyClientFactory creates fresh httpx clients
-        # on each A2A invocation in the current event loop context
+        # Create root agent once per worker - session and auth headers are
+        # injected per request, so the agent graph is safe to reuse
         try:
             root_agent, agents_cards = await get_agent_and_card(
                 session_id=session_id, actor_id=actor_id
@@ -119,34 +128,83 @@ def load_api_keys_from_ssm(config_data: dict) -> dict:
         'GOOGLE_API_KEY': 'google_api_key'
     }
 
-    for env_var, param_key in key_mapping.items():
+    # Resolve all configured parameter paths with one batched SSM call
+    # instead of one round trip per key
+    param_paths = {
+        env_var: parameters.get(param_key)
+        for env_var, param_key in key_mapping.items()
+    }
+    ssm_values = {}
+    configured_paths = [path for path in param_paths.values() if path]
+    if configured_paths:
         try:
-            # Try SSM first
-            param_path = parameters.get(param_key)
-            if param_path:
-                logger.info(f"Retrieving {env_var} from SSM: {param_path}")
-                api_keys[env_var] = get_parameter_from_ssm(param_path, region)
-                logger.info(f"✅ Successfully retrieved {env_var} from SSM")
-            else:
-                # Fall back to environment variable
-                logger.warning(f"No SSM parameter configured for {env_var}, checking environment variables")
-                value = os.getenv(env_var)
-                if value:
-                    api_keys[env_var] = value
-                    logger.info(f"✅ Loaded {env_var} from environment variable")
-                else:
-                    logger.error(f"❌ {env_var} not found in SSM or environment variables")
+            logger.info(f"Retrieving {len(configured_paths)} parameters from SSM in one batch")
+            ssm_values = get_parameters_from_ssm(configured_paths, region)
         except Exception as e:
-            # Fall back to environment variable on any error
-            logger.warning(f"Failed to retrieve {env_var} from SSM: {e}. Falling back to environment variable.")
-            value = os.getenv(env_var)
-            if value:
-                api_keys[env_var] = value
-                logger.info(f"✅ Loaded {env_var} from environment variable (fallback)")
-            else:
-                logger.error(f"❌ {env_var} not found in SSM or environment variables")
+            logger.warning(f"Batched SSM retrieval failed: {e}. Falling back to environment variables.")
+
+    for env_var, param_path in param_paths.items():
+        value = ssm_values.get(param_path) if param_path else None
+        if value:
+            api_keys[env_var] = value
+            logger.info(f"✅ Successfully retrieved {env_var} from SSM")
+            continue
+
+        # Fall back to environment variable
+        if param_path:
+            logger.warning(f"{env_var} not returned by SSM, checking environment variables")
+        else:
+            logger.warning(f"No SSM parameter configured for {env_var}, checking environment variables")
+        value = os.getenv(env_var)
+        if value:
+            api_keys[env_var] = value
+            logger.info(f"✅ Loaded {env_var} from environment variable")
+        else:
+            logger.error(f"❌ {env_var} not found in SSM or environment variables")
 
     return api_keys
+
+
+@functools.lru_cache(maxsize=8)
+def _ssm_client(region_name: str):
+    """Reuse one SSM client per region instead of constructing per call."""
+    return boto3.client('ssm', region_name=region_name)
+
+
+def get_parameters_from_ssm(
+    parameter_names: list,
+    region_name: str = "us-west-2",
+    decrypt: bool = True
+) -> dict:
+    """
+    Retrieve multiple parameters from SSM Parameter Store in batched calls.
+
+    Uses the GetParameters API (up to 10 names per request) so N keys cost
+    ceil(N/10) round trips instead of N.
+
+    Args:
+        parameter_names: Names of the SSM parameters to fetch
+        region_name: AWS region where the parameters are stored
+        decrypt: Whether to decrypt SecureString parameters
+
+    Returns:
+        Dict mapping parameter name to value; missing parameters are logged
+        and omitted
+    """
+    ssm_client = _ssm_client(region_name)
+    values = {}
+    for i in range(0, len(parameter_names), 10):
+        response = ssm_client.get_parameters(
+            Names=parameter_names[i:i + 10],
+            WithDecryption=decrypt
+        )
+        for parameter in response['Parameters']:
+            values[parameter['Name']] = parameter['Value']
+        for name in response.get('InvalidParameters', []):
+            logger.error(f"SSM parameter '{name}' not found in region {region_name}")
+    return values
+
+
 def get_parameter_from_ssm(
     parameter_name: str,
     region_name: str = "us-west-2",
@@ -166,7 +224,7 @@ def get_parameter_from_ssm(
     Raises:
         ClientError: If parameter not found or access denied
     """
-    ssm_client = boto3.client('ssm', region_name=region_name)
+    ssm_client = _ssm_client(region_name)
     try:
         response = ssm_client.get_parameter(
             Name=parameter_name,
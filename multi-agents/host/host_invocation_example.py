@@ -1,18 +1,24 @@
 import asyncio
-import json
+import functools
+import io
 import logging
 import os
-from pathlib import Path
+import sys
 from uuid import uuid4
 from urllib.parse import quote
 
 import boto3
 import httpx
-import requests
-import yaml
 from a2a.client import A2ACardResolver, ClientConfig, ClientFactory
 from a2a.types import Message, Part, Role, TextPart
 
+try:
+    from host._config_cache import get_config
+    from host.utils import json_dumps, json_loads
+except ImportError:
+    from _config_cache import get_config
+    from utils import json_dumps, json_loads
+
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
@@ -21,49 +27,80 @@ DEFAULT_TIMEOUT = 300  # set request timeout to 5 minutes
 # Global agent configuration cache
 agent_configs = {}
 
+# Shared async HTTP client for token fetches; pooled connections avoid a
+# TCP/TLS handshake to Cognito per call.
+_HTTPX = httpx.AsyncClient(
+    timeout=30.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
 def load_agent_configs():
     """Load agent configurations from config.yaml file."""
     global agent_configs
-    config_path = Path(__file__).parent / "config.yaml"
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-        for agent_config in config.get("agents", []):
-            agent_configs[agent_config["name"]] = agent_config
+    config = get_config()
+    for agent_config in config.get("agents", []):
+        agent_configs[agent_config["name"]] = agent_config
     logger.info(f"Loaded {len(agent_configs)} agent configurations")
 
+@functools.lru_cache(maxsize=1)
+def _host_agent_lookup():
+    """Build O(1) lookup tables over the host-agent config section.
+
+    Indexing by runtime ARN and lowercased name once at first use replaces
+    the linear substring scan that ran on every invocation.
+    """
+    host_agents = get_config().get("host-agent") or []
+    by_arn = {a["runtime_arn"]: a for a in host_agents}
+    by_name_lower = {a["name"].lower(): a for a in host_agents}
+    return by_arn, by_name_lower
+
+@functools.lru_cache(maxsize=32)
 def fetch_ssm_parameter(parameter_path: str, region: str) -> dict:
-    """Fetch IDP configuration from SSM Parameter Store."""
+    """Fetch IDP configuration from SSM Parameter Store (cached per path)."""
     ssm = boto3.client("ssm", region_name=region)
     response = ssm.get_parameter(Name=parameter_path, WithDecryption=True)
     config_str = response["Parameter"]["Value"]
-    return json.loads(config_str)
+    return json_loads(config_str)
+
+def _token_request(idp_config: dict) -> tuple:
+    """Return (token_endpoint, token_data) for idp_config, computed once.
+
+    fetch_ssm_parameter caches idp_config per path, so the static endpoint
+    URL and client-credentials form body are memoized on the dict instead of
+    rebuilt on every token fetch.
+    """
+    cached = idp_config.get("_token_request")
+    if cached is None:
+        domain = idp_config["domain"]
+        region = idp_config["user_pool_id"].split("_")[0]
+        token_endpoint = f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
+
+        scopes = idp_config.get("scopes", [])
+        resource_server = idp_config["resource_server_identifier"]
+        scope_str = " ".join(f"{resource_server}/{scope}" for scope in scopes)
+
+        token_data = {
+            "grant_type": "client_credentials",
+            "client_id": idp_config["client_id"],
+            "client_secret": idp_config["client_secret"],
+            "scope": scope_str,
+        }
+        cached = idp_config["_token_request"] = (token_endpoint, token_data)
+    return cached
 
 async def get_bearer_token(idp_config: dict) -> str:
     """Get OAuth bearer token using client credentials flow."""
-    domain = idp_config["domain"]
-    region = idp_config["user_pool_id"].split("_")[0]
-    token_endpoint = f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
-    
-    scopes = idp_config.get("scopes", [])
-    resource_server = idp_config["resource_server_identifier"]
-    scope_str = " ".join([f"{resource_server}/{scope}" for scope in scopes])
-    
-    token_data = {
-        "grant_type": "client_credentials",
-        "client_id": idp_config["client_id"],
-        "client_secret": idp_config["client_secret"],
-        "scope": scope_str,
-    }
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            token_endpoint,
-            data=token_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        response.raise_for_status()
-        token_response = response.json()
-        return token_response["access_token"]
+    token_endpoint, token_data = _token_request(idp_config)
+
+    response = await _HTTPX.post(
+        token_endpoint,
+        data=token_data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    token_response = response.json()
+    return token_response["access_token"]
 
 def format_agent_response(response):
     """Extract and format agent response for human readability."""
@@ -82,42 +119,49 @@ def format_agent_response(response):
     return ''.join(agent_messages)
 
 def format_agent_trace(response):
-    """Format agent response as a readable trace of calls."""
-    print("=" * 60)
-    print("🔍 AGENT EXECUTION TRACE")
-    print("=" * 60)
-    
+    """Format agent response as a readable trace of calls.
+
+    The trace is assembled in memory and flushed with one stdout write; a
+    print() per history entry costs a stdout lock/flush round trip each.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    write("=" * 60 + "\n")
+    write("🔍 AGENT EXECUTION TRACE\n")
+    write("=" * 60 + "\n")
+
     # Context info
-    print(f"📋 Context ID: {response.context_id}")
-    print(f"🆔 Task ID: {response.id}")
-    print(f"📊 Status: {response.status.state.value}")
-    print(f"⏰ Completed: {response.status.timestamp}")
-    print()
-    
+    write(f"📋 Context ID: {response.context_id}\n")
+    write(f"🆔 Task ID: {response.id}\n")
+    write(f"📊 Status: {response.status.state.value}\n")
+    write(f"⏰ Completed: {response.status.timestamp}\n\n")
+
     # Trace through history
-    print("🔄 EXECUTION FLOW:")
-    print("-" * 40)
-    
+    write("🔄 EXECUTION FLOW:\n")
+    write("-" * 40 + "\n")
+
     for i, msg in enumerate(response.history, 1):
-        role_icon = "👤" if msg.role.value == "user" else "🤖"
+        role = msg.role.value
+        role_icon = "👤" if role == "user" else "🤖"
         text = msg.parts[0].root.text if msg.parts else "[No content]"
-        
+
         # Truncate long messages for trace view
         if len(text) > 80:
             text = text[:77] + "..."
-            
-        print(f"{i:2d}. {role_icon} {msg.role.value.upper()}: {text}")
-    
-    print()
-    print("✅ FINAL RESULT:")
-    print("-" * 40)
-    
+
+        write(f"{i:2d}. {role_icon} {role.upper()}: {text}\n")
+
+    write("\n✅ FINAL RESULT:\n")
+    write("-" * 40 + "\n")
+
     # Final artifact
     if response.artifacts:
         final_text = response.artifacts[0].parts[0].root.text
-        print(final_text[:200] + "..." if len(final_text) > 200 else final_text)
-    
-    print("=" * 60)
+        write(final_text[:200] + "..." if len(final_text) > 200 else final_text)
+        write("\n")
+
+    write("=" * 60 + "\n")
+    sys.stdout.write(buf.getvalue())
 
 def create_message(*, role: Role = Role.user, text: str) -> Message:
     return Message(
@@ -137,25 +181,25 @@ async def send_sync_message(agent_name: str, message: str):
     region = config["region"]
     ssm_path = config["ssm_idp_config_path"]
     
-    print(f"Connecting to agent: {agent_name}")
-    print(f"Runtime ARN: {runtime_arn}")
-    print(f"Region: {region}")
-    
+    logger.info("Connecting to agent: %s", agent_name)
+    logger.info("Runtime ARN: %s", runtime_arn)
+    logger.info("Region: %s", region)
+
     try:
         # Fetch IDP config and get bearer token
         idp_config = fetch_ssm_parameter(ssm_path, region)
         bearer_token = await get_bearer_token(idp_config)
-        
-        escaped_agent_arn = quote(runtime_arn, safe='')
-        runtime_url = f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations/"
-        print(f"Runtime URL: {runtime_url}")
+
+        # URL is escaped and assembled once at config load
+        runtime_url = config["_runtime_url"]
+        logger.info("Runtime URL: %s", runtime_url)
     except Exception as e:
-        print(f"Error during setup: {e}")
+        logger.error("Error during setup: %s", e)
         raise
-    
+
     # Generate a unique session ID
     session_id = str(uuid4())
-    print(f"Generated session ID: {session_id}")
+    logger.info("Generated session ID: %s", session_id)
 
     # Add authentication headers for AgentCore
     headers = {"Authorization": f"Bearer {bearer_token}",
@@ -165,7 +209,7 @@ async def send_sync_message(agent_name: str, message: str):
         # Get agent card from the runtime URL
         resolver = A2ACardResolver(httpx_client=httpx_client, base_url=runtime_url)
         agent_card = await resolver.get_agent_card()
-        print(agent_card)
+        logger.debug("%s", agent_card)
 
         # Agent card contains the correct URL (same as runtime_url in this case)
         # No manual override needed - this is the path-based mounting pattern
@@ -201,20 +245,15 @@ async def send_sync_message(agent_name: str, message: str):
 
 async def test_host_agent_direct(orchestration_arn: str, region: str, prompt: str):
     """Test host agent using direct HTTP requests (for host orchestrator agent)."""
-    # Load host agent config to get SSM path
-    config_path = Path(__file__).parent / "config.yaml"
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    
-    # Find host agent config (assuming it's named "Host_Agent" or similar)
-    host_config = None
-    for agent_config in config.get("host-agent", []):
-        if "host" in agent_config["name"].lower() or agent_config["runtime_arn"] == orchestration_arn:
-            host_config = agent_config
-            break
-    
+    # Find host agent config by ARN, falling back to a name containing
+    # "host" (e.g. "Host_Agent")
+    by_arn, by_name_lower = _host_agent_lookup()
+    host_config = by_arn.get(orchestration_arn) or next(
+        (a for name, a in by_name_lower.items() if "host" in name), None
+    )
+
     if not host_config:
-        print(f"Host agent config not found for ARN: {orchestration_arn}")
+        logger.error("Host agent config not found for ARN: %s", orchestration_arn)
         return
     
     ssm_path = host_config["ssm_idp_config_path"]
@@ -225,7 +264,7 @@ async def test_host_agent_direct(orchestration_arn: str, region: str, prompt: st
         bearer_token = await get_bearer_token(idp_config)
         
         session_id = str(uuid4())
-        print(f'Invoking for session: {session_id}')
+        logger.info('Invoking for session: %s', session_id)
         
         headers = {
             'Authorization': f'Bearer {bearer_token}',
@@ -235,29 +274,37 @@ async def test_host_agent_direct(orchestration_arn: str, region: str, prompt: st
         }
         
         payload = {"prompt": prompt}
-        
-        escaped_agent_arn = quote(orchestration_arn, safe='')
-        
-        response = requests.post(
-            f'https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations',
-            headers=headers,
-            data=json.dumps(payload),
-            stream=True
-        )
-        
-        print(f"Response status: {response.status_code}")
-        
-        for line in response.iter_lines(decode_unicode=True):
-            if line.startswith('data: '):
-                data = line[6:]
-                try:
-                    parsed = json.loads(data)
-                    print(parsed)
-                except:
-                    print(data)
-                    
+
+        # Prefer the URL precomputed at config load; escape on the fly only
+        # when the config entry was matched by name with a different ARN
+        if host_config["runtime_arn"] == orchestration_arn:
+            url = host_config["_runtime_url"].rstrip('/')
+        else:
+            escaped_agent_arn = quote(orchestration_arn, safe='')
+            url = f'https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations'
+
+        # Stream asynchronously over the shared pooled client so the event
+        # loop stays free for the duration of the agent response
+        async with _HTTPX.stream(
+            'POST', url, headers=headers, content=json_dumps(payload),
+            timeout=DEFAULT_TIMEOUT
+        ) as response:
+            logger.info("Response status: %s", response.status_code)
+
+            # Accumulate SSE events and flush once at the end; a print() per
+            # event blocks the stream loop on terminal I/O
+            events = []
+            async for line in response.aiter_lines():
+                if line.startswith('data: '):
+                    data = line[6:]
+                    try:
+                        events.append(str(json_loads(data)))
+                    except ValueError:
+                        events.append(data)
+            print('\n'.join(events))
+
     except Exception as e:
-        print(f"Error testing host agent: {e}")
+        logger.error("Error testing host agent: %s", e)
 
 
 async def main():
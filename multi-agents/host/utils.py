@@ -1,7 +1,41 @@
 import boto3
 from boto3.session import Session
+import json
+import logging
 import sys
 
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for JSON encode/decode on the host hot paths (SSE event
+# parsing, SSM config payloads); it is several times faster than stdlib json
+# in both directions. The stdlib fallback keeps local dev working without it.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> bytes:
+        """Serialize to UTF-8 bytes (orjson native output)."""
+        return orjson.dumps(obj)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        """Serialize to UTF-8 bytes to match the orjson signature."""
+        return json.dumps(obj).encode()
+
+# Prefer the libyaml C extension for config parsing (~3-15x faster than the
+# pure-Python parser). Fall back when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None)
+if _YAML_LOADER is None:
+    logger.warning(
+        "yaml.CSafeLoader unavailable (PyYAML built without libyaml); "
+        "falling back to the slower pure-Python SafeLoader"
+    )
+    _YAML_LOADER = yaml.SafeLoader
+
 
 def get_ssm_parameter(name: str, with_decryption: bool = True) -> str:
     """Get parameter from AWS Systems Manager Parameter Store."""
@@ -1,11 +1,20 @@
 import asyncio
+import codecs
+import functools
+import io
 import json
 import logging
 import os
+import queue
+import re
+import threading
 import time
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any
+from dataclasses import dataclass
 import boto3
+from botocore.config import Config
 from bedrock_agentcore import BedrockAgentCoreApp
 from strands import Agent, tool
 import PyPDF2
@@ -22,6 +31,15 @@ from bedrock_agentcore.memory.session import MemorySession, MemorySessionManager
 USER = MessageRole.USER
 ASSISTANT = MessageRole.ASSISTANT
 
+# orjson parses multi-KB LLM outputs 2-5x faster than stdlib json; fall back
+# to stdlib when it is not installed. Both raise ValueError subclasses on
+# malformed input.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configuration
 REGION = os.getenv('AWS_REGION', 'us-east-1') # AWS region for the agent
 ACTOR_ID = "user_123" # It can be any unique identifier (AgentID, User ID, etc.)
@@ -31,119 +49,236 @@ SESSION_ID = "personal_session_001" # Unique session identifier
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize AWS clients
-s3_client = boto3.client('s3')
+# Initialize AWS clients. The S3 client is shared across requests with a
+# raised connection-pool ceiling (default botocore pool is 10, which
+# serializes concurrent downloads), adaptive retries, and TCP keepalive so
+# TLS connections stay warm between requests.
+_S3_CFG = Config(
+    max_pool_connections=int(os.getenv("S3_POOL", "64")),
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True,
+)
+s3_client = boto3.client('s3', config=_S3_CFG)
 
 # Environment variables
 MODEL_ID = os.environ.get('MODEL_ID', 'us.anthropic.claude-3-5-sonnet-20241022-v2:0')
 DOCUMENTS_BUCKET = os.environ.get('DOCUMENTS_BUCKET', 'hr-agents-documents-agentcore')
+
+# PDF extraction backend. pypdfium2 binds PDFium (C++) and is typically
+# 5-10x faster than pure-Python PyPDF2 on text-heavy PDFs, so it is the
+# default; set PDF_BACKEND=pypdf2 to roll back to the pure-Python path.
+PDF_BACKEND = os.environ.get('PDF_BACKEND', 'pypdfium2').lower()
+if PDF_BACKEND == 'pypdfium2':
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        logger.warning("pypdfium2 not installed; falling back to PyPDF2 for PDF extraction")
+        PDF_BACKEND = 'pypdf2'
+        pdfium = None
+else:
+    pdfium = None
 # Initialize AgentCore app
 app = BedrockAgentCoreApp()
 
-# Initialize Memory Manager 
+# Initialize Memory Manager
 memory_manager = MemoryManager(region_name=REGION)
 memory_name = "ResumeAnalyzerMemoryManager"
 
 logger.info(f"✅ MemoryManager initialized for region: {REGION}")
 logger.info(f"Memory manager type: {type(memory_manager)}")
 
-# Create memory resource using MemoryManager
-logger.info(f"Creating memory '{memory_name}' for short-term conversational storage...")
+# Memory resources are created lazily on first use. get_or_create_memory is
+# a synchronous AWS control-plane call; running it at import time blocked
+# every cold start before the first request could be served and killed the
+# worker outright when it failed.
+_memory = None
+_session_manager = None
+_memory_init_lock = threading.Lock()
 
-try:
-    memory = memory_manager.get_or_create_memory(
-        name=memory_name,
-        strategies=[],  # No strategies for short-term memory
-        description="Short-term memory for resume analyzer",
-        event_expiry_days=7,  # Retention period for short-term memory
-        memory_execution_role_arn=None,  # Optional for short-term memory
-    )
-    memory_id = memory.id
-    logger.info(f"✅ Successfully created/retrieved memory with MemoryManager:")
-    logger.info(f"   Memory ID: {memory_id}")
-    logger.info(f"   Memory Name: {memory.name}")
-    logger.info(f"   Memory Status: {memory.status}")
-    
-except Exception as e:
-    # Handle any errors during memory creation with enhanced error reporting
-    logger.error(f"❌ Memory creation failed: {e}")
-    logger.error(f"Error type: {type(e).__name__}")
-    import traceback
-    traceback.print_exc()
-    
-    # Cleanup on error - delete the memory if it was partially created
-    if 'memory_id' in locals():
-        try:
-            logger.info(f"Attempting cleanup of partially created memory: {memory_id}")
-            memory_manager.delete_memory(memory_id)
-            logger.info(f"✅ Successfully cleaned up memory: {memory_id}")
-        except Exception as cleanup_error:
-            logger.error(f"❌ Failed to clean up memory: {cleanup_error}")
-    
-    # Re-raise the original exception
-    raise
+# Global session tracking. slots=True keeps attribute access a fixed-offset
+# load instead of a per-instance dict probe.
+@dataclass(slots=True)
+class _SessionState:
+    session: Any = None
+    session_id: str = None
+
+_STATE = _SessionState()
 
-# Initialize the session memory manager
-session_manager = MemorySessionManager(memory_id=memory.id, region_name=REGION)
+def _ensure_memory():
+    """Create/retrieve the memory resource and session manager on first use"""
+    global _memory, _session_manager
 
-# Global session tracking
-current_session = None
-current_session_id = None
+    if _memory is not None:
+        return _memory
 
-logger.info(f"✅ Session manager initialized for memory: {memory.id}")
+    with _memory_init_lock:
+        if _memory is not None:
+            return _memory
+
+        logger.info(f"Creating memory '{memory_name}' for short-term conversational storage...")
+        memory_id = None
+        try:
+            memory = memory_manager.get_or_create_memory(
+                name=memory_name,
+                strategies=[],  # No strategies for short-term memory
+                description="Short-term memory for resume analyzer",
+                event_expiry_days=7,  # Retention period for short-term memory
+                memory_execution_role_arn=None,  # Optional for short-term memory
+            )
+            memory_id = memory.id
+            logger.info(f"✅ Successfully created/retrieved memory with MemoryManager:")
+            logger.info(f"   Memory ID: {memory_id}")
+            logger.info(f"   Memory Name: {memory.name}")
+            logger.info(f"   Memory Status: {memory.status}")
+
+        except Exception:
+            # logger.exception formats the traceback lazily through the
+            # logging machinery instead of printing it to stderr
+            logger.exception("❌ Memory creation failed")
+
+            # Cleanup on error - delete the memory if it was partially created
+            if memory_id is not None:
+                try:
+                    logger.info(f"Attempting cleanup of partially created memory: {memory_id}")
+                    memory_manager.delete_memory(memory_id)
+                    logger.info(f"✅ Successfully cleaned up memory: {memory_id}")
+                except Exception as cleanup_error:
+                    logger.error(f"❌ Failed to clean up memory: {cleanup_error}")
+
+            # Re-raise the original exception
+            raise
+
+        # Initialize the session memory manager
+        _session_manager = MemorySessionManager(memory_id=memory.id, region_name=REGION)
+        _memory = memory
+        logger.info(f"✅ Session manager initialized for memory: {memory.id}")
+
+    return _memory
+
+async def _get_memory():
+    """Async wrapper for _ensure_memory; the control-plane call runs in a
+    worker thread so warmup doesn't block the event loop"""
+    return await asyncio.to_thread(_ensure_memory)
+
+# Memory writes are enqueued and flushed in batches by a background thread,
+# so the per-message add_turns round trip stays out of the streaming hot
+# path. Batches fill up to _MEMORY_FLUSH_BATCH messages or for
+# _MEMORY_FLUSH_INTERVAL seconds, whichever comes first. A plain
+# queue.Queue (not asyncio) because the Strands hooks fire from sync
+# agent threads.
+_MEMORY_WRITE_Q: queue.Queue = queue.Queue()
+_MEMORY_FLUSH_BATCH = 32
+_MEMORY_FLUSH_INTERVAL = 0.05
+
+def _memory_flusher():
+    """Drain queued memory writes in batches, grouped per session"""
+    while True:
+        item = _MEMORY_WRITE_Q.get()
+        batch = [item]
+        deadline = time.monotonic() + _MEMORY_FLUSH_INTERVAL
+        while len(batch) < _MEMORY_FLUSH_BATCH:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_MEMORY_WRITE_Q.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        by_session = {}
+        for session, message in batch:
+            by_session.setdefault(id(session), (session, []))[1].append(message)
+
+        for session, messages in by_session.values():
+            try:
+                result = session.add_turns(messages=messages)
+                logger.info(f"✅ Stored batch of {len(messages)} message(s), Event ID: {result['eventId']}")
+            except Exception:
+                logger.exception("Memory save error")
+
+threading.Thread(target=_memory_flusher, name="memory-flusher", daemon=True).start()
+
+def _message_role(message) -> str:
+    """Role of an EventMessage object or message dict"""
+    role = getattr(message, 'role', None)
+    if role is not None:
+        return role
+    return message.get('role', 'unknown')
+
+def _message_text(message) -> str:
+    """Text content of an EventMessage object or message dict"""
+    content = getattr(message, 'content', None)
+    if content is not None:
+        return content
+    return message.get('content', {}).get('text', '')
+
+# Formatted conversation context per memory session, so warm agent starts
+# skip re-formatting the same recent turns. Keyed by the session's id string
+# plus a fingerprint of the latest message (the SDK exposes no event id
+# here); bounded with insertion-order eviction like the tool result cache.
+_CTX_CACHE: Dict[tuple, str] = {}
+_CTX_CACHE_MAX = 64
 
 class MemoryHookProvider(HookProvider):
+    # One provider is built per agent; slots skip the per-instance __dict__
+    __slots__ = ("memory_session",)
+
     def __init__(self, memory_session: MemorySession):  # Accept MemorySession instead
         self.memory_session = memory_session
-    
+
     def on_agent_initialized(self, event: AgentInitializedEvent):
         """Load recent conversation history when agent starts using MemorySession"""
         try:
             # Use the pre-configured memory session (no need for actor_id/session_id)
             recent_turns = self.memory_session.get_last_k_turns(k=5)
-            
+
             if recent_turns:
-                # Format conversation history for context
-                context_messages = []
-                for turn in recent_turns:
-                    for message in turn:
-                        # Handle both EventMessage objects and dict formats
-                        if hasattr(message, 'role') and hasattr(message, 'content'):
-                            role = message['role']
-                            content = message['content']
-                        else:
-                            role = message.get('role', 'unknown')
-                            content = message.get('content', {}).get('text', '')
-                        context_messages.append(f"{role}: {content}")
-                
-                context = "\n".join(context_messages)
+                # The session_id string is stable; id() of the session object
+                # could be reused after garbage collection and leak another
+                # session's history into the key
+                cache_key = (
+                    getattr(self.memory_session, 'session_id', None) or _STATE.session_id,
+                    len(recent_turns),
+                    _message_text(recent_turns[-1][-1])[:64] if recent_turns[-1] else '',
+                )
+                context = _CTX_CACHE.get(cache_key)
+                if context is None:
+                    # Format conversation history for context in one pass;
+                    # bind the accessors to locals for the comprehension
+                    role_of, text_of = _message_role, _message_text
+                    context = "\n".join(
+                        f"{role_of(message)}: {text_of(message)}"
+                        for turn in recent_turns
+                        for message in turn
+                    )
+                    if len(_CTX_CACHE) >= _CTX_CACHE_MAX:
+                        # Evict the oldest entry (dicts preserve insertion order)
+                        _CTX_CACHE.pop(next(iter(_CTX_CACHE)))
+                    _CTX_CACHE[cache_key] = context
+
                 # Add context to agent's system prompt
                 event.agent.system_prompt += f"\n\nRecent conversation:\n{context}"
                 logger.info(f"✅ Loaded {len(recent_turns)} conversation turns using MemorySession")
-                
+
         except Exception as e:
             logger.error(f"Memory load error: {e}")
 
     def on_message_added(self, event: MessageAddedEvent):
-        """Store messages in memory using MemorySession"""
+        """Queue messages for batched background writes to memory"""
         messages = event.agent.messages
         try:
             if messages and len(messages) > 0 and messages[-1]["content"][0].get("text"):
                 message_text = messages[-1]["content"][0]["text"]
                 message_role = MessageRole.USER if messages[-1]["role"] == "user" else MessageRole.ASSISTANT
-                
-                # Use memory session instance (no need to pass actor_id/session_id)
-                result = self.memory_session.add_turns(
-                    messages=[ConversationalMessage(message_text, message_role)]
+
+                # Hand off to the flusher thread; the streaming path only
+                # pays for an enqueue
+                _MEMORY_WRITE_Q.put_nowait(
+                    (self.memory_session, ConversationalMessage(message_text, message_role))
                 )
-                
-                event_id = result['eventId']
-                logger.info(f"✅ Stored message with Event ID: {event_id}, Role: {message_role.value}")
-                
-        except Exception as e:
-            logger.error(f"Memory save error: {e}")
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+
+        except Exception:
+            logger.exception("Memory save error")
     
     def register_hooks(self, registry: HookRegistry):
         # Register memory hooks
@@ -153,22 +288,23 @@ class MemoryHookProvider(HookProvider):
 
 def get_or_create_session(resume_key: str = None, job_description_key: str = None):
     """Get existing session or create new one based on documents"""
-    global current_session, current_session_id
-    
     if resume_key:
-        # New document upload - create new session
+        # New document upload - create new session. BLAKE2b with an 8-byte
+        # digest gives the same 16-hex-char id as the old truncated MD5 but
+        # faster and without tripping security scanners on MD5.
         session_data = f"{resume_key}_{job_description_key or 'no_job'}"
-        session_id = hashlib.md5(session_data.encode()).hexdigest()[:16]
-        
-        if session_id != current_session_id:
-            current_session = session_manager.create_memory_session(
+        session_id = hashlib.blake2b(session_data.encode("utf-8"), digest_size=8).hexdigest()
+
+        if session_id != _STATE.session_id:
+            _ensure_memory()
+            _STATE.session = _session_manager.create_memory_session(
                 actor_id=ACTOR_ID,
                 session_id=session_id
             )
-            current_session_id = session_id
+            _STATE.session_id = session_id
             logger.info(f"✅ Created new session: {session_id}")
-    
-    return current_session
+
+    return _STATE.session
 
 async def process_query_with_strands_agents(query: str):
     """Process plain text queries using Strands agents with memory context"""
@@ -193,24 +329,31 @@ async def process_query_with_strands_agents(query: str):
 async def invoke(payload):
     """AgentCore entrypoint for HR resume evaluation"""
     try:
-        logger.info(f"🚀 Starting HR Agent invocation")
-        logger.info(f"📥 Received payload: {json.dumps(payload, indent=2)}")
-        
+        logger.info("🚀 Starting HR Agent invocation")
+        # Pretty-printing the full payload is multi-KB of string work per
+        # request; log the keys at INFO and the full dump only at DEBUG
+        logger.info("📥 Received payload keys: %s", list(payload.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📥 Received payload: %s", json.dumps(payload, indent=2))
+
+        # Ensure the memory resource exists before any session work
+        await _get_memory()
+
         # Check if this is a plain text query (follow-up question) or S3 document processing
         if 'query' in payload or 'message' in payload:
             # Handle plain text queries/follow-up questions
             query = payload.get('query') or payload.get('message', '')
-            logger.info(f"💬 Processing follow-up query: {query}")
+            logger.info("💬 Processing follow-up query: %s", query)
             agent_stream = await process_query_with_strands_agents(query)
         else:
             # Handle S3 document processing (original logic)
             bucket = payload.get('bucket', DOCUMENTS_BUCKET)
             resume_key = payload.get('resume_key')
             job_description_key = payload.get('job_description_key')
-            
-            logger.info(f"📂 Using bucket: {bucket}")
-            logger.info(f"📄 Resume key: {resume_key}")
-            logger.info(f"📋 Job description key: {job_description_key}")
+
+            logger.info("📂 Using bucket: %s", bucket)
+            logger.info("📄 Resume key: %s", resume_key)
+            logger.info("📋 Job description key: %s", job_description_key)
             
             # Create/update session based on documents
             get_or_create_session(resume_key, job_description_key)
@@ -223,50 +366,62 @@ async def invoke(payload):
             agent_stream = await process_resume_with_strands_agents(bucket, resume_key, job_description_key)
         tool_name = None
         event_count = 0
-        
+        total_chars = 0
+        # Evaluate the debug gate once; the per-event logs below run for
+        # every streamed chunk
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         try:
             async for event in agent_stream:
                 event_count += 1
-                logger.debug(f"📊 Processing event #{event_count}: {type(event)}")
+                if debug:
+                    logger.debug("📊 Processing event #%s: %s", event_count, type(event))
 
                 if (
                     "current_tool_use" in event
                     and event["current_tool_use"].get("name") != tool_name
                 ):
                     tool_name = event["current_tool_use"]["name"]
-                    logger.info(f"🔧 Agent using tool: {tool_name}")
+                    logger.info("🔧 Agent using tool: %s", tool_name)
                     yield f"\n\n🔧 Using tool: {tool_name}\n\n"
 
                 if "data" in event:
                     tool_name = None
-                    data_length = len(str(event["data"]))
-                    logger.debug(f"📤 Yielding data chunk of {data_length} characters")
-                    yield event["data"]
-                    
+                    # Track output volume without stringifying every chunk;
+                    # data is already str/bytes in the common case
+                    data = event["data"]
+                    if isinstance(data, (str, bytes)):
+                        total_chars += len(data)
+                    yield data
+
         except Exception as e:
-            logger.error(f"❌ Error in agent stream processing: {str(e)}")
+            logger.error("❌ Error in agent stream processing: %s", e)
             yield f"Error: {str(e)}"
-            
-        logger.info(f"✅ Completed processing {event_count} events")
-        
+
+        logger.info("✅ Completed processing %s events (%s chars streamed)", event_count, total_chars)
+
     except Exception as e:
-        logger.error(f"❌ Error in agent stream processing: {str(e)}")
+        logger.error("❌ Error in agent stream processing: %s", e)
         yield f"Error: {str(e)}"
 
 async def process_resume_with_strands_agents(bucket: str, resume_key: str, job_description_key: str) -> Dict[str, Any]:
     """Process resume using Strands multi-agent collaboration"""
     try:
-        logger.info(f"📥 Downloading resume from s3://{bucket}/{resume_key}")
-        # Download resume content from S3
-        resume_content = download_s3_file(bucket, resume_key)
-        logger.info(f"✅ Resume downloaded, length: {len(resume_content)} characters")
-        
-        # Download job description content from S3
         if job_description_key:
+            # Resume and job description are independent objects; download
+            # them concurrently
+            logger.info(f"📥 Downloading resume from s3://{bucket}/{resume_key}")
             logger.info(f"📥 Downloading job description from s3://{bucket}/{job_description_key}")
-            job_content = download_s3_file(bucket, job_description_key)
+            resume_content, job_content = await asyncio.gather(
+                download_s3_file(bucket, resume_key),
+                download_s3_file(bucket, job_description_key),
+            )
+            logger.info(f"✅ Resume downloaded, length: {len(resume_content)} characters")
             logger.info(f"✅ Job description downloaded, length: {len(job_content)} characters")
         else:
+            logger.info(f"📥 Downloading resume from s3://{bucket}/{resume_key}")
+            resume_content = await download_s3_file(bucket, resume_key)
+            logger.info(f"✅ Resume downloaded, length: {len(resume_content)} characters")
             logger.info("ℹ️ No job description provided, using default")
             job_content = "No specific job description provided."
         
@@ -275,25 +430,11 @@ async def process_resume_with_strands_agents(bucket: str, resume_key: str, job_d
         supervisor_agent = create_supervisor_agent()
         logger.info("✅ HR Supervisor agent created successfully")
         
-        # Create evaluation request
-        evaluation_request = f"""
-        Please evaluate this candidate for the position using your specialized agent team.
-        
-        RESUME:
-        {resume_content}
-        
-        JOB DESCRIPTION:
-        {job_content}
-
-        Work with your team to provide a comprehensive evaluation. Coordinate with:
-        1. ResumeParserAgent to extract structured information
-        2. JobAnalyzerAgent to analyze job requirements
-        3. ResumeEvaluatorAgent to evaluate candidate fit
-        4. GapIdentifierAgent to identify missing qualifications
-        5. CandidateRaterAgent to provide numerical rating
-
-        Provide your final response as a comprehensive markdown format.
-        """
+        # Create evaluation request. Only the documents vary per request;
+        # the evaluation instructions live in the supervisor's system prompt,
+        # where Bedrock prompt caching can reuse the tokenized preamble
+        # across requests instead of re-processing it inside every message.
+        evaluation_request = f"RESUME:\n{resume_content}\n\nJOB DESCRIPTION:\n{job_content}"
         
         # Execute evaluation
         logger.info("🚀 Starting AgentCore multi-agent evaluation...")
@@ -307,17 +448,9 @@ async def process_resume_with_strands_agents(bucket: str, resume_key: str, job_d
         logger.error(f"🔍 Error details: {type(e).__name__}")
         raise
 
-def create_supervisor_agent():
-    """Create the HR Supervisor agent with specialized tools"""
-    session = get_or_create_session()
-    memory_hook_provider = MemoryHookProvider(session)
-    
-    @tool
-    def extract_resume_info(resume_text: str) -> str:
-        """Extract structured information from resume text"""
-        parser_agent = Agent(
-            model=MODEL_ID,
-            system_prompt="""You are a Resume Parser Agent specializing in extracting structured information from resumes.
+# System prompts for the specialized agents, defined once at module scope so
+# the multi-KB strings aren't rebuilt per tool call
+PARSER_PROMPT = """You are a Resume Parser Agent specializing in extracting structured information from resumes.
 
 Extract the following information:
 1. Personal Information (name, contact, title, URLs)
@@ -327,17 +460,8 @@ Extract the following information:
 5. Projects (names, descriptions, technologies, outcomes)
 
 Structure your response as a JSON object with these categories."""
-        )
-        
-        result = parser_agent(resume_text)
-        return safe_extract_content(result)
-    
-    @tool
-    def analyze_job_requirements(job_description: str) -> str:
-        """Analyze job requirements"""
-        analyzer_agent = Agent(
-            model=MODEL_ID,
-            system_prompt="""You are a Job Analyzer Agent specializing in extracting job requirements.
+
+ANALYZER_PROMPT = """You are a Job Analyzer Agent specializing in extracting job requirements.
 
 Analyze and extract:
 1. Required Qualifications (education, experience, skills, certifications)
@@ -347,17 +471,8 @@ Analyze and extract:
 5. Compensation and Benefits (if provided)
 
 Structure your response as a JSON object with these categories."""
-        )
-        
-        result = analyzer_agent(job_description)
-        return safe_extract_content(result)
-    
-    @tool
-    def evaluate_candidate_fit(resume_info: str, job_requirements: str) -> str:
-        """Evaluate candidate fit"""
-        evaluator_agent = Agent(
-            model=MODEL_ID,
-            system_prompt="""You are a Resume Evaluator Agent specializing in comparing candidates against job requirements.
+
+EVALUATOR_PROMPT = """You are a Resume Evaluator Agent specializing in comparing candidates against job requirements.
 
 Evaluate:
 1. Skills Match Analysis (technical alignment, proficiency, missing skills)
@@ -366,18 +481,8 @@ Evaluate:
 4. Project Relevance Review (scale, technology alignment)
 
 Structure your response as a JSON object with detailed analysis."""
-        )
-        
-        evaluation_request = f"RESUME INFO:\n{resume_info}\n\nJOB REQUIREMENTS:\n{job_requirements}"
-        result = evaluator_agent(evaluation_request)
-        return safe_extract_content(result)
 
-    @tool
-    def identify_gaps(resume_info: str, job_requirements: str) -> str:
-        """Identify gaps and inconsistencies"""
-        gap_agent = Agent(
-            model=MODEL_ID,
-            system_prompt="""You are a Gap Identifier Agent specializing in finding gaps and inconsistencies.
+GAP_PROMPT = """You are a Gap Identifier Agent specializing in finding gaps and inconsistencies.
 
 Identify:
 1. Missing Qualifications (required skills, education, experience)
@@ -386,18 +491,8 @@ Identify:
 4. Areas Needing Clarification (vague accomplishments, unclear levels)
 
 Structure your response as a JSON object with specific examples."""
-        )
-        
-        gap_request = f"RESUME INFO:\n{resume_info}\n\nJOB REQUIREMENTS:\n{job_requirements}"
-        result = gap_agent(gap_request)
-        return safe_extract_content(result)
 
-    @tool
-    def rate_candidate(resume_info: str, job_requirements: str, evaluation_info: str) -> str:
-        """Rate candidate on 1-5 scale"""
-        rater_agent = Agent(
-            model=MODEL_ID,
-            system_prompt="""You are a Candidate Rater Agent specializing in scoring candidates on a 1-5 scale.
+RATER_PROMPT = """You are a Candidate Rater Agent specializing in scoring candidates on a 1-5 scale.
 
 Provide:
 1. Overall Fit Score (1-5 scale with clear criteria)
@@ -407,11 +502,131 @@ Provide:
 5. Risk Assessment (likelihood of success, challenges)
 
 Structure your response as a JSON object with numerical rating and analysis."""
-        )
-        
+
+# Specialized agents cached per role; Agent construction sets up the Bedrock
+# client and prompt state, so build each role once per process instead of on
+# every tool call. Agents are stateful (each call appends to agent.messages),
+# so every invocation holds the role's lock and clears the history first —
+# otherwise later evaluations would ship earlier candidates' conversations to
+# Bedrock, and concurrent requests would interleave the same history.
+_AGENT_CACHE: Dict[str, Agent] = {}
+_AGENT_LOCKS: Dict[str, threading.Lock] = {}
+_AGENT_CACHE_LOCK = threading.Lock()
+
+def _get_role_agent(role: str, prompt: str) -> tuple:
+    """Return (agent, lock) for a role, creating both on first use"""
+    with _AGENT_CACHE_LOCK:
+        agent = _AGENT_CACHE.get(role)
+        if agent is None:
+            agent = _AGENT_CACHE[role] = Agent(model=MODEL_ID, system_prompt=prompt)
+            _AGENT_LOCKS[role] = threading.Lock()
+        return agent, _AGENT_LOCKS[role]
+
+# Exact-match result cache for the per-role Bedrock calls, keyed by a hash of
+# role + input text. A hash and dict lookup is ~10^5x cheaper than an LLM
+# round trip, so re-evaluating the same resume/JD pair (e.g. a follow-up
+# question retriggering the supervisor) skips Bedrock entirely.
+_TOOL_CACHE: Dict[str, str] = {}
+_TOOL_CACHE_MAX = 512
+
+def _invoke_role(role: str, prompt: str, payload_text: str) -> str:
+    """Invoke the role agent, serving repeated inputs from the result cache"""
+    key = hashlib.blake2b(f"{role}|{payload_text}".encode(), digest_size=16).hexdigest()
+    cached = _TOOL_CACHE.get(key)
+    if cached is not None:
+        logger.info(f"✅ Cache hit for {role} tool call")
+        return cached
+
+    agent, lock = _get_role_agent(role, prompt)
+    with lock:
+        # Reset per invocation so each call is as stateless as the
+        # fresh-agent-per-call baseline
+        agent.messages = []
+        result = safe_extract_content(agent(payload_text))
+    if len(_TOOL_CACHE) >= _TOOL_CACHE_MAX:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _TOOL_CACHE.pop(next(iter(_TOOL_CACHE)))
+    _TOOL_CACHE[key] = result
+    return result
+
+async def _arun_role(role: str, prompt: str, payload_text: str) -> str:
+    """Async wrapper around _invoke_role; Strands agent calls are sync, so
+    run them in a worker thread to let independent calls overlap"""
+    return await asyncio.to_thread(_invoke_role, role, prompt, payload_text)
+
+async def run_pipeline(resume_text: str, job_description: str) -> Dict[str, str]:
+    """Run the full evaluation pipeline with independent stages in parallel.
+
+    Parser and analyzer only depend on the raw inputs, and evaluator and gap
+    identifier only depend on their combined outputs, so each pair runs
+    concurrently. Wall time drops from five sequential Bedrock round trips
+    to three.
+    """
+    parsed, analyzed = await asyncio.gather(
+        _arun_role("parser", PARSER_PROMPT, resume_text),
+        _arun_role("analyzer", ANALYZER_PROMPT, job_description),
+    )
+
+    combined = f"RESUME INFO:\n{parsed}\n\nJOB REQUIREMENTS:\n{analyzed}"
+    evaluation, gaps = await asyncio.gather(
+        _arun_role("evaluator", EVALUATOR_PROMPT, combined),
+        _arun_role("gap", GAP_PROMPT, combined),
+    )
+
+    rating = await _arun_role("rater", RATER_PROMPT, f"{combined}\n\nEVALUATION:\n{evaluation}")
+
+    return {
+        "resume_parsing": parsed,
+        "job_analysis": analyzed,
+        "evaluation": evaluation,
+        "gaps": gaps,
+        "rating": rating,
+    }
+
+def create_supervisor_agent():
+    """Create the HR Supervisor agent with specialized tools"""
+    session = get_or_create_session()
+    memory_hook_provider = MemoryHookProvider(session)
+
+    @tool
+    def extract_resume_info(resume_text: str) -> str:
+        """Extract structured information from resume text"""
+        return _invoke_role("parser", PARSER_PROMPT, resume_text)
+
+    @tool
+    def analyze_job_requirements(job_description: str) -> str:
+        """Analyze job requirements"""
+        return _invoke_role("analyzer", ANALYZER_PROMPT, job_description)
+
+    @tool
+    def evaluate_candidate_fit(resume_info: str, job_requirements: str) -> str:
+        """Evaluate candidate fit"""
+        evaluation_request = f"RESUME INFO:\n{resume_info}\n\nJOB REQUIREMENTS:\n{job_requirements}"
+        return _invoke_role("evaluator", EVALUATOR_PROMPT, evaluation_request)
+
+    @tool
+    def identify_gaps(resume_info: str, job_requirements: str) -> str:
+        """Identify gaps and inconsistencies"""
+        gap_request = f"RESUME INFO:\n{resume_info}\n\nJOB REQUIREMENTS:\n{job_requirements}"
+        return _invoke_role("gap", GAP_PROMPT, gap_request)
+
+    @tool
+    def rate_candidate(resume_info: str, job_requirements: str, evaluation_info: str) -> str:
+        """Rate candidate on 1-5 scale"""
         rating_request = f"RESUME INFO:\n{resume_info}\n\nJOB REQUIREMENTS:\n{job_requirements}\n\nEVALUATION:\n{evaluation_info}"
-        result = rater_agent(rating_request)
-        return safe_extract_content(result)
+        return _invoke_role("rater", RATER_PROMPT, rating_request)
+
+    @tool
+    async def run_full_evaluation(resume_text: str, job_description: str) -> str:
+        """Run the complete specialist evaluation pipeline in one call"""
+        results = await run_pipeline(resume_text, job_description)
+        return (
+            f"RESUME PARSING:\n{results['resume_parsing']}\n\n"
+            f"JOB ANALYSIS:\n{results['job_analysis']}\n\n"
+            f"EVALUATION:\n{results['evaluation']}\n\n"
+            f"GAP ANALYSIS:\n{results['gaps']}\n\n"
+            f"RATING:\n{results['rating']}"
+        )
 
 
     # Create the main HR Supervisor Agent
@@ -419,21 +634,26 @@ Structure your response as a JSON object with numerical rating and analysis."""
         model=MODEL_ID,
         hooks= [memory_hook_provider],
         tools=[
+            run_full_evaluation,
             extract_resume_info,
-            analyze_job_requirements, 
+            analyze_job_requirements,
             evaluate_candidate_fit,
             identify_gaps,
             rate_candidate
         ],
         system_prompt="""You are the Supervisor Agent for HR resume evaluation running on Amazon Bedrock AgentCore Runtime.
 
-Coordinate with your specialized team to provide comprehensive candidate evaluations:
+You will receive a message containing a RESUME and a JOB DESCRIPTION. Evaluate the candidate for the position using your specialized agent team and provide a comprehensive evaluation.
 
-1. Have ResumeParserAgent extract structured information from the resume
-2. Have JobAnalyzerAgent analyze the job requirements
-3. Have ResumeEvaluatorAgent evaluate candidate fit
-4. Have GapIdentifierAgent identify missing qualifications
-5. Have CandidateRaterAgent provide numerical rating (1-5 scale)
+Coordinate with your specialized team to provide comprehensive candidate evaluations.
+
+Prefer a single run_full_evaluation call with the resume and job description; it runs the whole specialist team (parser, analyzer, evaluator, gap identifier, rater) with independent steps in parallel. Only use the individual tools to re-run a specific step:
+
+1. extract_resume_info: ResumeParserAgent extracts structured information from the resume
+2. analyze_job_requirements: JobAnalyzerAgent analyzes the job requirements
+3. evaluate_candidate_fit: ResumeEvaluatorAgent evaluates candidate fit
+4. identify_gaps: GapIdentifierAgent identifies missing qualifications
+5. rate_candidate: CandidateRaterAgent provides numerical rating (1-5 scale)
 
 CRITICAL: Output your final evaluation in this EXACT Markdown format:
 
@@ -486,61 +706,55 @@ CRITICAL: Output your final evaluation in this EXACT Markdown format:
     
     return supervisor_agent
 
+def _text_from_items(items) -> str:
+    """Join the text fields of a content-part list"""
+    return '\n'.join(
+        item.text if hasattr(item, 'text')
+        else item['text'] if isinstance(item, dict) and 'text' in item
+        else str(item)
+        for item in items
+    )
+
+def _extract_from_dict(result: dict) -> str:
+    """Extract text from AgentCore dict response formats"""
+    if 'role' in result and 'content' in result:
+        content = result['content']
+        return _text_from_items(content) if isinstance(content, list) else str(content)
+    if 'message' in result:
+        message = result['message']
+        if isinstance(message, dict) and 'content' in message:
+            content = message['content']
+            return _text_from_items(content) if isinstance(content, list) else str(content)
+        return str(message)
+    return str(result)
+
+# Exact-type dispatch for the common response shapes; one dict lookup
+# replaces the old chain of hasattr/isinstance probes
+_EXTRACTORS = {dict: _extract_from_dict, str: lambda s: s}
+
 def safe_extract_content(result) -> str:
     """Extract text content from Strands agent response"""
     try:
-        # Handle different response formats
-        if hasattr(result, 'content') and isinstance(result.content, list):
-            text_parts = []
-            for item in result.content:
-                if hasattr(item, 'text'):
-                    text_parts.append(item.text)
-                elif isinstance(item, dict) and 'text' in item:
-                    text_parts.append(item['text'])
-                else:
-                    text_parts.append(str(item))
-            return '\n'.join(text_parts)
-        elif hasattr(result, 'content'):
-            return str(result.content)
-        elif hasattr(result, 'message'):
-            return str(result.message)
-        elif isinstance(result, dict):
-            # Handle dict response format from AgentCore
-            if 'role' in result and 'content' in result:
-                content = result['content']
-                if isinstance(content, list):
-                    text_parts = []
-                    for item in content:
-                        if isinstance(item, dict) and 'text' in item:
-                            text_parts.append(item['text'])
-                        else:
-                            text_parts.append(str(item))
-                    return '\n'.join(text_parts)
-                else:
-                    return str(content)
-            # Handle message format
-            elif 'message' in result:
-                message = result['message']
-                if isinstance(message, dict) and 'content' in message:
-                    content = message['content']
-                    if isinstance(content, list):
-                        text_parts = []
-                        for item in content:
-                            if isinstance(item, dict) and 'text' in item:
-                                text_parts.append(item['text'])
-                            else:
-                                text_parts.append(str(item))
-                        return '\n'.join(text_parts)
-                    else:
-                        return str(content)
-                else:
-                    return str(message)
-            # Handle direct text content
-            elif isinstance(result, str):
-                return result
-            return str(result)
-        else:
-            return str(result)
+        extractor = _EXTRACTORS.get(type(result))
+        if extractor is not None:
+            return extractor(result)
+
+        # Attribute-based response objects (AgentResult and friends)
+        content = getattr(result, 'content', None)
+        if isinstance(content, list):
+            return _text_from_items(content)
+        if content is not None:
+            return str(content)
+
+        message = getattr(result, 'message', None)
+        if message is not None:
+            # A dict message gets its text extracted rather than being
+            # stringified into a repr that safe_parse_json must peel
+            if isinstance(message, dict):
+                return _extract_from_dict(message)
+            return str(message)
+
+        return str(result)
     except Exception as e:
         logger.error(f"Error extracting content: {str(e)}")
         logger.debug(f"Result type: {type(result)}, Result: {str(result)[:500]}")
@@ -635,213 +849,320 @@ def parse_evaluation_result(evaluation_result, resume_key: str, resume_content:
             "evaluated_by": "Strands AgentCore Multi-Agent System (Error)"
         }
 
+# Patterns used by safe_parse_json, compiled once instead of per call
+_TEXT_START = re.compile(r"'text':\s*'")
+_TEXT_END = re.compile(r"'\s*\}\s*\]\s*\}\s*$")
+_THINKING = re.compile(r'<thinking>.*?</thinking>\s*', re.DOTALL)
+# Match only the opening fence; the body is then consumed by raw_decode,
+# avoiding the lazy-quantifier backtracking of capturing (\{.*?\})
+_JSON_FENCE = re.compile(r'```(?:json)?\s*', re.IGNORECASE)
+_WS = re.compile(r'\s+')
+_UNESC = re.compile(r'\\(.)')
+# Positional decoder: raw_decode() scans balanced JSON in C instead of a
+# Python char-by-char brace count
+_DECODER = json.JSONDecoder()
+_ESC_MAP = {'\\': '\\', "'": "'", 'n': '\n', '"': '"'}
+# Narrower variant for escaped JSON strings: one regex pass instead of
+# chained str.replace calls, each of which copies the whole buffer
+_JSON_ESC = re.compile(r'\\(["n\\])')
+_JSON_ESC_MAP = {'"': '"', 'n': '\n', '\\': '\\'}
+
+def _unescape(text: str) -> str:
+    """Resolve backslash escapes in one pass over the buffer"""
+    return _UNESC.sub(lambda m: _ESC_MAP.get(m.group(1), m.group(0)), text)
+
 def safe_parse_json(content: str) -> Dict[str, Any]:
     """Safely parse JSON from text content"""
     try:
         content = content.strip()
 
-        logger.info(f"🔍 Parsing JSON from content type: {type(content)}")
-        logger.info(f"🔍 Content starts with: {content[:100]}")
+        # Cheap C-level prefilter: with no opening brace anywhere, none of
+        # the recovery strategies below can succeed, so skip them all
+        if content.find('{') == -1:
+            logger.warning("No valid JSON structure found in content: %.200s...", content)
+            return None
+
+        # Dispatch on the first character instead of running every prefix
+        # check and regex scan against payloads they can never match
+        first = content[:1]
+
+        logger.debug("🔍 Parsing JSON from content type: %s", type(content))
+        logger.debug("🔍 Content starts with: %.100s", content)
 
         # Handle Python dict string representation: "{'role': 'assistant', 'content': [{'text': 'JSON_HERE'}]}"
-        if content.startswith("{'role': 'assistant', 'content': [{'text': '") and content.endswith("'}]}"):
-            logger.info("🔍 Detected Python dict string representation")
+        if first == '{' and content.startswith("{'role': 'assistant', 'content': [{'text': '") and content.endswith("'}]}"):
+            logger.debug("🔍 Detected Python dict string representation")
             # Use regex to extract the JSON from the text field instead of ast.literal_eval
-            import re
             try:
                 # Find the start of the text content after 'text': '
-                text_start_pattern = r"'text':\s*'"
-                text_start_match = re.search(text_start_pattern, content)
+                text_start_match = _TEXT_START.search(content)
                 if text_start_match:
                     start_pos = text_start_match.end()
-                    # Find the end by looking for the closing pattern '}]}
-                    # We need to work backwards from the end to handle escaped quotes
-                    end_pattern = r"'\s*\}\s*\]\s*\}\s*$"
 
-                    # Search for the end pattern
-                    end_match = re.search(end_pattern, content)
+                    # Find the end by looking for the closing pattern '}]}
+                    end_match = _TEXT_END.search(content)
                     if end_match:
                         end_pos = end_match.start()
                         # Extract the text content between start and end
                         text_content = content[start_pos:end_pos]
 
-                        # Unescape the content - handle backslash escaping
-                        text_content = text_content.replace('\\\\', '\x00')  # Temporarily replace double backslash
-                        text_content = text_content.replace("\\'", "'").replace('\\n', '\n').replace('\\"', '"')
-                        text_content = text_content.replace('\x00', '\\')  # Restore single backslashes
+                        # Unescape the content in a single pass
+                        text_content = _unescape(text_content)
 
-                        logger.info(f"🔍 Extracted text content length: {len(text_content)}")
-                        logger.info(f"🔍 Text content preview: {text_content[:200]}...")
+                        logger.debug("🔍 Extracted text content length: %s", len(text_content))
+                        logger.debug("🔍 Text content preview: %.200s...", text_content)
 
                         # Clean up the text content - remove thinking tags and find JSON
                         if '<thinking>' in text_content and '</thinking>' in text_content:
                             # Remove thinking sections
-                            text_content = re.sub(r'<thinking>.*?</thinking>\s*', '', text_content, flags=re.DOTALL)
-                            logger.info(f"🔍 Removed thinking tags, new length: {len(text_content)}")
-                            logger.info(f"🔍 Content after thinking removal: {text_content[:200]}...")
+                            text_content = _THINKING.sub('', text_content)
+                            logger.debug("🔍 Removed thinking tags, new length: %s", len(text_content))
+                            logger.debug("🔍 Content after thinking removal: %.200s...", text_content)
 
-                        # Clean up the text content more thoroughly
+                        # Strip surrounding whitespace/newlines
                         text_content = text_content.strip()
 
-                        # Remove any leading/trailing whitespace and newlines
-                        while text_content.startswith(('\n', '\r', ' ', '\t')):
-                            text_content = text_content[1:]
-                        while text_content.endswith(('\n', '\r', ' ', '\t')):
-                            text_content = text_content[:-1]
-
-                        logger.info(f"🔍 Cleaned content starts with: '{text_content[:50]}...'")
-                        logger.info(f"🔍 Cleaned content ends with: '...{text_content[-50:]}'")
+                        logger.debug("🔍 Cleaned content starts with: '%.50s...'", text_content)
+                        logger.debug("🔍 Cleaned content ends with: '...%s'", text_content[-50:])
 
                         # Find the JSON part
                         if text_content.startswith('{') and text_content.endswith('}'):
-                            logger.info("🔍 Content looks like JSON, attempting to parse")
+                            logger.debug("🔍 Content looks like JSON, attempting to parse")
                             try:
-                                return json.loads(text_content)
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"🔍 JSON parse failed: {str(e)}")
-                                logger.warning(f"🔍 Failed content preview: '{text_content[:100]}...'")
+                                return _json_loads(text_content)
+                            except ValueError as e:
+                                logger.warning("🔍 JSON parse failed: %s", e)
+                                logger.warning("🔍 Failed content preview: '%.100s...'", text_content)
 
                         # Look for JSON structure in the content
                         start_idx = text_content.find('{')
                         if start_idx != -1:
-                            logger.info(f"🔍 Found JSON structure at position {start_idx}")
-                            brace_count = 0
-                            end_idx = start_idx
-
-                            for i in range(start_idx, len(text_content)):
-                                if text_content[i] == '{':
-                                    brace_count += 1
-                                elif text_content[i] == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        end_idx = i + 1
-                                        break
-
-                            if brace_count == 0:
-                                json_text = text_content[start_idx:end_idx]
-                                logger.info(f"🔍 Extracted JSON substring length: {len(json_text)}")
-                                logger.info(f"🔍 JSON substring preview: '{json_text[:100]}...'")
-                                try:
-                                    return json.loads(json_text)
-                                except json.JSONDecodeError as e:
-                                    logger.warning(f"🔍 JSON substring parse failed: {str(e)}")
+                            logger.debug("🔍 Found JSON structure at position %s", start_idx)
+                            try:
+                                obj, _ = _DECODER.raw_decode(text_content, start_idx)
+                                return obj
+                            except ValueError as e:
+                                logger.warning("🔍 JSON substring parse failed: %s", e)
 
                         # If we get here, try to parse as-is
-                        logger.info("🔍 Attempting final direct parse")
-                        return json.loads(text_content)
+                        logger.debug("🔍 Attempting final direct parse")
+                        return _json_loads(text_content)
                     else:
                         logger.warning("🔍 Failed to find end pattern in content")
                 else:
                     logger.warning("🔍 Failed to find text start pattern in content")
             except Exception as e:
-                logger.warning(f"🔍 Failed to parse Python dict with improved regex: {str(e)}")
+                logger.warning("🔍 Failed to parse Python dict with improved regex: %s", e)
 
         # Handle escaped JSON strings first
         if '\\\"' in content:
-            content = content.replace('\\\"', '"').replace('\\n', '\n').replace('\\\\', '\\')
+            content = _JSON_ESC.sub(lambda m: _JSON_ESC_MAP[m.group(1)], content)
 
         # Try direct JSON parsing first
-        if content.startswith('{') and content.endswith('}'):
-            logger.info("🔍 Attempting direct JSON parsing")
-            return json.loads(content)
-
-        # Look for JSON in markdown code blocks
-        import re
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        json_match = re.search(json_pattern, content, re.DOTALL | re.IGNORECASE)
-
-        if json_match:
-            logger.info("🔍 Found JSON in markdown code block")
-            json_text = json_match.group(1).strip()
-            if '\\\"' in json_text:
-                json_text = json_text.replace('\\\"', '"').replace('\\n', '\n')
-            return json.loads(json_text)
+        if first == '{' and content.endswith('}'):
+            logger.debug("🔍 Attempting direct JSON parsing")
+            return _json_loads(content)
 
-        # Look for JSON structure anywhere in the content
-        start_idx = content.find('{')
-        if start_idx != -1:
-            logger.info(f"🔍 Found JSON structure starting at index {start_idx}")
-            brace_count = 0
-            end_idx = start_idx
-
-            for i in range(start_idx, len(content)):
-                if content[i] == '{':
-                    brace_count += 1
-                elif content[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_idx = i + 1
-                        break
-
-            if brace_count == 0:
-                json_text = content[start_idx:end_idx]
-                logger.info(f"🔍 Extracted JSON text length: {len(json_text)}")
-                if '\\\"' in json_text:
-                    json_text = json_text.replace('\\\"', '"').replace('\\n', '\n')
+        # Look for JSON in markdown code blocks; a payload opening with a
+        # brace is handled by the direct/embedded scans above and below
+        if first != '{':
+            json_match = _JSON_FENCE.search(content)
+
+            if json_match:
+                logger.debug("🔍 Found JSON in markdown code block")
                 try:
-                    return json.loads(json_text)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"🔍 JSON decode error: {str(e)}")
-                    # Try cleaning up common formatting issues
-                    json_text = json_text.replace('\n', ' ').replace('\t', ' ')
-                    # Remove extra spaces
-                    json_text = re.sub(r'\s+', ' ', json_text)
-                    return json.loads(json_text)
-
-        # Log the content for debugging if no JSON found
-        logger.warning(f"No valid JSON structure found in content: {content[:200]}...")
-        return None
+                    obj, _ = _DECODER.raw_decode(content, json_match.end())
+                    return obj
+                except ValueError as e:
+                    logger.warning("🔍 Fenced JSON parse failed: %s", e)
+
+        # Look for JSON structure anywhere in the content. The prefilter
+        # guarantees a brace exists; re-find since the escape pass above may
+        # have shifted its offset
+        start_idx = content.find('{')
+        logger.debug("🔍 Found JSON structure starting at index %s", start_idx)
+        try:
+            obj, _ = _DECODER.raw_decode(content, start_idx)
+            return obj
+        except ValueError as e:
+            logger.warning("🔍 JSON decode error: %s", e)
+            # Try cleaning up common formatting issues: resolve escaped
+            # quotes/newlines and collapse whitespace runs, then rescan
+            json_text = content[start_idx:]
+            if '\\\"' in json_text:
+                json_text = _JSON_ESC.sub(lambda m: _JSON_ESC_MAP[m.group(1)], json_text)
+            json_text = _WS.sub(' ', json_text)
+            obj, _ = _DECODER.raw_decode(json_text)
+            return obj
 
     except Exception as e:
-        logger.error(f"JSON parsing error: {str(e)}")
-        logger.debug(f"Content that failed to parse: {content[:500]}")
+        logger.error("JSON parsing error: %s", e)
+        logger.debug("Content that failed to parse: %.500s", content)
         return None
 
-def download_s3_file(bucket: str, key: str) -> str:
-    """Download and read content from S3 file (supports txt, docx, pdf)"""
+# Bound concurrent S3 transfers so a burst of invocations can't exhaust the
+# worker threads or the S3 connection pool
+_S3_SEM = asyncio.Semaphore(int(os.getenv("S3_CONCURRENCY", "32")))
+
+# Parallel range-read settings for large objects (S3A-style prefetching):
+# objects at least one block large are fetched as concurrent ranged GETs
+_S3_PREFETCH_BLOCK = int(os.getenv("S3_PREFETCH_BLOCK", str(8 * 1024 * 1024)))
+_S3_PREFETCH_COUNT = int(os.getenv("S3_PREFETCH_COUNT", "8"))
+
+def _get_object_sync(bucket: str, key: str) -> bytes:
+    """Fetch a whole object body (blocking)"""
+    return s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+def _get_range_sync(bucket: str, key: str, start: int, end: int, buf: bytearray):
+    """Fetch one byte range into its slot of the shared buffer (blocking)"""
+    response = s3_client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}")
+    buf[start:end + 1] = response["Body"].read()
+
+async def _fetch_s3_object(bucket: str, key: str) -> bytes:
+    """Fetch an object's bytes, range-reading large objects in parallel.
+
+    A single GetObject is limited by one TCP stream. For objects of at least
+    _S3_PREFETCH_BLOCK bytes, issue ranged GETs concurrently and write each
+    block into a pre-sized bytearray at its offset, which typically gives a
+    2-4x throughput gain on multi-MB documents. Small objects use one GET.
+    """
+    head = await asyncio.to_thread(s3_client.head_object, Bucket=bucket, Key=key)
+    size = head["ContentLength"]
+
+    if size < _S3_PREFETCH_BLOCK:
+        return await asyncio.to_thread(_get_object_sync, bucket, key)
+
+    buf = bytearray(size)
+    sem = asyncio.Semaphore(_S3_PREFETCH_COUNT)
+
+    async def fetch_block(start: int):
+        end = min(start + _S3_PREFETCH_BLOCK, size) - 1
+        async with sem:
+            await asyncio.to_thread(_get_range_sync, bucket, key, start, end, buf)
+
+    await asyncio.gather(*(fetch_block(start) for start in range(0, size, _S3_PREFETCH_BLOCK)))
+    return bytes(buf)
+
+def _read_text_stream(bucket: str, key: str) -> str:
+    """Stream-decode a text object straight off the response body.
+
+    Feeding 1 MiB chunks through an incremental decoder avoids buffering the
+    whole object as bytes before decoding, halving peak memory per in-flight
+    text download.
+    """
+    body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts = [decoder.decode(chunk) for chunk in body.iter_chunks(1 << 20)]
+    parts.append(decoder.decode(b'', True))
+    return ''.join(parts)
+
+async def download_s3_file(bucket: str, key: str) -> str:
+    """Download and read content from an S3 file without blocking the event loop.
+
+    boto3 is synchronous, so transfers run in worker threads; independent
+    downloads (resume + job description) can then overlap via asyncio.gather
+    while the loop stays free for other requests. Text objects stream through
+    an incremental decoder; PDF/DOCX are fetched as bytes because extraction
+    runs in a process pool and bytes are what pickles across it.
+    """
     try:
-        import tempfile
-        
-        # Download file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            s3_client.download_fileobj(bucket, key, temp_file)
-            temp_path = temp_file.name
-        
-        try:
-            # Determine file type from S3 key extension
+        async with _S3_SEM:
             file_extension = Path(key).suffix.lower()
-            
-            if file_extension == '.txt':
-                with open(temp_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-            
-            elif file_extension == '.docx':
-                doc = Document(temp_path)
-                return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-            
-            elif file_extension == '.pdf':
-                with open(temp_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    text = ''
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + '\n'
-                    return text
-            
-            else:
-                # Default to text for unknown extensions
-                with open(temp_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-                    
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_path)
-            
+            if file_extension not in ('.pdf', '.docx'):
+                return await asyncio.to_thread(_read_text_stream, bucket, key)
+            body = await _fetch_s3_object(bucket, key)
+            return await _parse_document(key, body)
     except Exception as e:
         logger.error(f"Error downloading/reading S3 file {bucket}/{key}: {str(e)}")
         raise
 
+# PDF/DOCX extraction is CPU-bound pure Python; run it in worker processes
+# so it never stalls the event loop serving other invocations. Multi-page
+# PDFs beyond _PDF_SHARD_THRESHOLD pages are sharded across the pool.
+_DOC_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+_PDF_SHARD_THRESHOLD = 50
+
+def _extract_pdf_text(body: bytes, start: int = 0, end: int = None) -> str:
+    """Extract text from PDF pages [start, end); top-level so it pickles"""
+    if PDF_BACKEND == 'pypdfium2':
+        pdf = pdfium.PdfDocument(io.BytesIO(body))
+        if end is None:
+            end = len(pdf)
+        return ''.join(pdf[i].get_textpage().get_text_range() + '\n' for i in range(start, end))
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(body))
+    pages = pdf_reader.pages
+    if end is None:
+        end = len(pages)
+    return ''.join(pages[i].extract_text() + '\n' for i in range(start, end))
+
+def _extract_docx_text(body: bytes) -> str:
+    """Extract paragraph text from a DOCX document; top-level so it pickles"""
+    doc = Document(io.BytesIO(body))
+    return '\n'.join(paragraph.text for paragraph in doc.paragraphs)
+
+def _extract_pdf_small(body: bytes, max_pages: int) -> tuple:
+    """Open a PDF once, count pages, and extract when at most max_pages.
+
+    Returns (text, page_count); text is None for larger documents so the
+    caller can shard them without paying a second open-and-count trip for
+    the common small case. Top-level so it pickles.
+    """
+    if PDF_BACKEND == 'pypdfium2':
+        pdf = pdfium.PdfDocument(io.BytesIO(body))
+        page_count = len(pdf)
+        if page_count > max_pages:
+            return None, page_count
+        return ''.join(
+            pdf[i].get_textpage().get_text_range() + '\n' for i in range(page_count)
+        ), page_count
+
+    pages = PyPDF2.PdfReader(io.BytesIO(body)).pages
+    page_count = len(pages)
+    if page_count > max_pages:
+        return None, page_count
+    return ''.join(page.extract_text() + '\n' for page in pages), page_count
+
+async def _parse_document(key: str, body: bytes) -> str:
+    """Parse document content into text (supports txt, docx, pdf)"""
+    try:
+        # Determine file type from S3 key extension
+        file_extension = Path(key).suffix.lower()
+        loop = asyncio.get_running_loop()
+
+        if file_extension == '.docx':
+            return await loop.run_in_executor(_DOC_POOL, _extract_docx_text, body)
+
+        if file_extension == '.pdf':
+            # A single pool trip opens, counts, and extracts small documents;
+            # only documents large enough to shard pay a second submission
+            text, page_count = await loop.run_in_executor(
+                _DOC_POOL, _extract_pdf_small, body, _PDF_SHARD_THRESHOLD
+            )
+            if text is not None:
+                return text
+
+            # Shard page ranges across the pool and rejoin in order
+            shard = -(-page_count // (os.cpu_count() or 1))
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    _DOC_POOL, _extract_pdf_text, body, start, min(start + shard, page_count)
+                )
+                for start in range(0, page_count, shard)
+            ))
+            return ''.join(parts)
+
+        # Default to text for .txt and unknown extensions
+        return body.decode('utf-8')
+
+    except Exception as e:
+        logger.error(f"Error reading document {key}: {str(e)}")
+        raise
+
+@functools.lru_cache(maxsize=1024)
 def extract_name_from_key(s3_key: str) -> str:
-    """Extract candidate name from S3 key"""
+    """Extract candidate name from S3 key (memoized; keys repeat across
+    batch evaluations and error paths)"""
     try:
         filename = Path(s3_key).stem
         name = filename.replace('_', ' ').replace('-', ' ')
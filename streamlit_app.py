@@ -9,16 +9,40 @@ which coordinates between monitoring and operations agents using A2A protocol.
 import streamlit as st
 import json
 import asyncio
+import re
 import sys
 import os
+import threading
+import time
 from datetime import datetime
+from html import escape
 from pathlib import Path
 from uuid import uuid4
 from urllib.parse import quote
 import boto3
-import requests
+import httpx
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; ~10x faster than the
+# pure-Python SafeLoader on cold start
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson parses/serializes JSON 2-5x faster than stdlib; fall back to the
+# stdlib when it is not installed. Both raise ValueError subclasses on
+# malformed input.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Page configuration
 st.set_page_config(
     page_title="A2A Host Agent Chat",
@@ -26,6 +50,38 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+async def _new_httpx_client() -> httpx.AsyncClient:
+    """Construct the shared client on the loop it will be used from"""
+    return httpx.AsyncClient(timeout=30.0)
+
+@st.cache_resource
+def _async_resources() -> tuple:
+    """Background event loop plus the shared httpx client bound to it.
+
+    asyncio.run() per chat turn would tear down the loop each time, and
+    pooled httpx connections die with the loop they were opened on; a
+    persistent loop lets keep-alive connections survive across turns.
+    Both live behind st.cache_resource because Streamlit re-executes the
+    script per rerun, resetting module globals — a global client would be
+    recreated (and its connections leaked onto the long-lived loop) on
+    every message.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    client = asyncio.run_coroutine_threadsafe(_new_httpx_client(), loop).result()
+    return loop, client
+
+def _run_async(coro):
+    """Run a coroutine on the persistent loop and wait for its result"""
+    loop, _ = _async_resources()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+async def _get_httpx_client() -> httpx.AsyncClient:
+    """Shared async HTTP client; reusing it keeps Cognito/AgentCore
+    connections warm instead of paying a TCP+TLS handshake per message"""
+    _, client = _async_resources()
+    return client
+
 def load_custom_css():
     """Load custom CSS for better styling"""
     st.markdown("""
@@ -69,37 +125,44 @@ def initialize_session_state():
     """Initialize Streamlit session state"""
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
-    if 'host_config' not in st.session_state:
-        st.session_state.host_config = None
+    # Resolve the shared caches while still in script-run context so the
+    # background-loop coroutines only ever see warm st.cache_resource entries
+    _token_caches()
+
+# Parsed once per process and shared across sessions; st.cache_resource
+# survives script reruns, unlike module globals, which Streamlit resets on
+# every interaction
+@st.cache_resource
+def _parse_host_config():
+    """Parse config.yaml and return the first host agent entry"""
+    config_path = Path(__file__).parent / "multi-agents" / "host" / "config.yaml"
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    # Get the first host agent config
+    host_agents = config.get("host-agent", [])
+    return host_agents[0] if host_agents else None
 
 def load_host_config():
-    """Load host agent configuration from config.yaml"""
-    if st.session_state.host_config is None:
-        try:
-            config_path = Path(__file__).parent / "multi-agents" / "host" / "config.yaml"
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-                # Get the first host agent config
-                host_agents = config.get("host-agent", [])
-                if host_agents:
-                    st.session_state.host_config = host_agents[0]
-                    return st.session_state.host_config
-        except Exception as e:
-            st.error(f"Failed to load host config: {str(e)}")
-            return None
-    return st.session_state.host_config
+    """Load host agent configuration from config.yaml (parsed once)"""
+    try:
+        return _parse_host_config()
+    except Exception as e:
+        st.error(f"Failed to load host config: {str(e)}")
+        return None
 
 def fetch_ssm_parameter(parameter_path: str, region: str) -> dict:
     """Fetch IDP configuration from SSM Parameter Store."""
     ssm = boto3.client("ssm", region_name=region)
     response = ssm.get_parameter(Name=parameter_path, WithDecryption=True)
     config_str = response["Parameter"]["Value"]
-    return json.loads(config_str)
+    return _json_loads(config_str)
 
-async def get_bearer_token(idp_config: dict) -> str:
-    """Get OAuth bearer token using client credentials flow."""
-    import httpx
-    
+async def get_bearer_token(idp_config: dict) -> tuple[str, int]:
+    """Get an OAuth bearer token using the client credentials flow.
+
+    Returns (access_token, expires_in seconds) so callers can cache the
+    token until shortly before it expires.
+    """
     domain = idp_config["domain"]
     region = idp_config["user_pool_id"].split("_")[0]
     token_endpoint = f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
@@ -115,15 +178,40 @@ async def get_bearer_token(idp_config: dict) -> str:
         "scope": scope_str,
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            token_endpoint,
-            data=token_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        response.raise_for_status()
-        token_response = response.json()
-        return token_response["access_token"]
+    client = await _get_httpx_client()
+    response = await client.post(
+        token_endpoint,
+        data=token_data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    token_response = response.json()
+    return token_response["access_token"], token_response.get("expires_in", 3600)
+
+# Bearer tokens are valid for ~an hour, so fetching SSM config plus a fresh
+# Cognito token per message wastes two network round trips per chat turn.
+# The cache dicts live behind st.cache_resource: module globals are reset
+# every script rerun, so plain dicts here could never produce a hit.
+@st.cache_resource
+def _token_caches() -> tuple:
+    """(token cache, IDP-config cache), both keyed by SSM path"""
+    return {}, {}
+
+async def _get_bearer_token_cached(ssm_path: str, region: str) -> str:
+    """Return a cached bearer token, refreshing 60s before expiry."""
+    token_cache, idp_cache = _token_caches()
+
+    entry = token_cache.get(ssm_path)
+    if entry and entry["expires_at"] > time.time():
+        return entry["token"]
+
+    idp_config = idp_cache.get(ssm_path)
+    if idp_config is None:
+        idp_config = idp_cache[ssm_path] = fetch_ssm_parameter(ssm_path, region)
+
+    token, expires_in = await get_bearer_token(idp_config)
+    token_cache[ssm_path] = {"token": token, "expires_at": time.time() + expires_in - 60}
+    return token
 
 async def send_message_to_host(message: str):
     """Send message to host agent and return response"""
@@ -136,9 +224,8 @@ async def send_message_to_host(message: str):
         region = host_config["region"]
         ssm_path = host_config["ssm_idp_config_path"]
         
-        # Fetch IDP config and get bearer token
-        idp_config = fetch_ssm_parameter(ssm_path, region)
-        bearer_token = await get_bearer_token(idp_config)
+        # Fetch IDP config and get bearer token (both cached across turns)
+        bearer_token = await _get_bearer_token_cached(ssm_path, region)
         
         session_id = str(uuid4())
         
@@ -152,53 +239,57 @@ async def send_message_to_host(message: str):
         payload = {"prompt": message}
         
         escaped_agent_arn = quote(runtime_arn, safe='')
-        
-        response = requests.post(
-            f'https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations',
-            headers=headers,
-            data=json.dumps(payload),
-            stream=True
-        )
-        
-        if response.status_code != 200:
-            return f"Error: HTTP {response.status_code}"
-        
+        url = f'https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations'
+
         # Parse streaming response
         response_parts = []
         transfer_agent = None
         final_text = None
-        
-        for line in response.iter_lines(decode_unicode=True):
-            if line.startswith('data: '):
-                data = line[6:]
+
+        # Stream asynchronously over the shared client; the synchronous
+        # requests call blocked the event loop for the whole agent response
+        client = await _get_httpx_client()
+        async with client.stream(
+            'POST', url, headers=headers, content=_json_dumps(payload), timeout=None
+        ) as response:
+            if response.status_code != 200:
+                return f"Error: HTTP {response.status_code}"
+
+            async for line in response.aiter_lines():
+                if not line.startswith('data: '):
+                    continue
+                data = line.removeprefix('data: ')
                 try:
-                    parsed = json.loads(data)
+                    parsed = _json_loads(data)
                     
                     if isinstance(parsed, dict):
-                        # Check for function call (transfer)
-                        if 'content' in parsed and 'parts' in parsed['content']:
-                            for part in parsed['content']['parts']:
-                                if 'function_call' in part and part['function_call']:
-                                    func_call = part['function_call']
-                                    if func_call.get('name') == 'transfer_to_agent':
-                                        transfer_agent = func_call.get('args', {}).get('agent_name')
-                                
+                        # Single .get chain per field instead of a membership
+                        # test followed by a lookup; this loop runs per SSE line
+                        parts = (parsed.get('content') or {}).get('parts')
+                        if parts:
+                            for part in parts:
+                                # Check for function call (transfer)
+                                func_call = part.get('function_call')
+                                if func_call and func_call.get('name') == 'transfer_to_agent':
+                                    transfer_agent = func_call.get('args', {}).get('agent_name')
+
                                 # Get final text response
-                                if 'text' in part and part['text'] and len(part['text']) > 50:
-                                    final_text = part['text']
-                        
+                                if (text := part.get('text')) and len(text) > 50:
+                                    final_text = text
+
                         # Check actions for transfer info
-                        if 'actions' in parsed and parsed['actions'].get('transfer_to_agent'):
-                            transfer_agent = parsed['actions']['transfer_to_agent']
-                        
+                        actions = parsed.get('actions')
+                        if actions and actions.get('transfer_to_agent'):
+                            transfer_agent = actions['transfer_to_agent']
+
                         # Collect text parts
-                        if 'text' in parsed and parsed['text']:
-                            response_parts.append(parsed['text'])
-                    
+                        if text := parsed.get('text'):
+                            response_parts.append(text)
+
                     elif isinstance(parsed, str):
                         response_parts.append(parsed)
                         
-                except json.JSONDecodeError:
+                except ValueError:
                     if data.strip():
                         response_parts.append(data)
         
@@ -224,6 +315,14 @@ async def send_message_to_host(message: str):
     except Exception as e:
         return f"Error: {str(e)}"
 
+# Compiled once at import; every rerun re-rendered the whole chat history,
+# so sanitizing per render made each interaction cost O(history length)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def _clean_agent_content(content: str) -> str:
+    """Strip HTML tags and escape the remainder for safe chat rendering"""
+    return escape(_HTML_TAG_RE.sub('', content), quote=False)
+
 def main():
     """Main Streamlit app"""
     load_custom_css()
@@ -255,9 +354,11 @@ def main():
         
         # Chat statistics
         st.subheader("📊 Chat Stats")
+        # Count in one pass without building throwaway lists; this runs on
+        # every rerun over the full history
         total_messages = len(st.session_state.chat_history)
-        user_messages = len([m for m in st.session_state.chat_history if m["type"] == "user"])
-        agent_messages = len([m for m in st.session_state.chat_history if m["type"] == "agent"])
+        user_messages = sum(1 for m in st.session_state.chat_history if m["type"] == "user")
+        agent_messages = total_messages - user_messages
         
         st.metric("Total Messages", total_messages)
         st.metric("Your Messages", user_messages)
@@ -270,32 +371,35 @@ def main():
     # Main chat interface
     st.header("💬 Chat with Host Agent")
     
-    # Display chat history
+    # Display chat history in a single markdown block; each st.markdown
+    # call is its own frontend update, so per-message calls made every
+    # rerun cost O(history length) websocket frames
     chat_container = st.container(height=400)
     with chat_container:
+        blocks = []
         for message in st.session_state.chat_history:
+            timestamp = message['timestamp'].strftime('%H:%M:%S')
             if message["type"] == "user":
-                st.markdown(f"""
+                blocks.append(f"""
                 <div class="chat-message user-message">
                     <strong>👤 You</strong><br>
-                    <small>{message['timestamp'].strftime('%H:%M:%S')}</small><br>
+                    <small>{timestamp}</small><br>
                     {message['content']}
                 </div>
-                """, unsafe_allow_html=True)
-            
+                """)
+
             elif message["type"] == "agent":
-                # Clean up HTML tags and escape remaining HTML
-                import re
-                clean_content = re.sub(r'<[^>]+>', '', message['content'])  # Remove HTML tags
-                clean_content = clean_content.replace('&lt;', '<').replace('&gt;', '>')  # Unescape
-                clean_content = clean_content.replace('<', '&lt;').replace('>', '&gt;')  # Re-escape for display
-                st.markdown(f"""
+                # Sanitized once when the message was appended
+                blocks.append(f"""
                 <div class="chat-message agent-message">
                     <strong>🤖 Host Agent</strong><br>
-                    <small>{message['timestamp'].strftime('%H:%M:%S')}</small><br>
-                    {clean_content}
+                    <small>{timestamp}</small><br>
+                    {message['clean_content']}
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+
+        if blocks:
+            st.markdown(''.join(blocks), unsafe_allow_html=True)
     
     # Example prompts
     st.markdown("**💡 Example prompts:**")
@@ -340,13 +444,15 @@ def main():
         # Send to host agent
         with st.spinner("🤖 Host agent is thinking..."):
             try:
-                response = asyncio.run(send_message_to_host(user_message))
+                response = _run_async(send_message_to_host(user_message))
                 
-                # Add agent response to history
+                # Add agent response to history, sanitized once here rather
+                # than on every rerun
                 st.session_state.chat_history.append({
                     "type": "agent",
                     "timestamp": datetime.now(),
-                    "content": response
+                    "content": response,
+                    "clean_content": _clean_agent_content(response)
                 })
                 
                 st.rerun()
@@ -355,10 +461,12 @@ def main():
                 st.error(f"Error: {str(e)}")
                 
                 # Add error to history
+                error_text = f"Error: {str(e)}"
                 st.session_state.chat_history.append({
                     "type": "agent",
                     "timestamp": datetime.now(),
-                    "content": f"Error: {str(e)}"
+                    "content": error_text,
+                    "clean_content": _clean_agent_content(error_text)
                 })
                 
                 st.rerun()